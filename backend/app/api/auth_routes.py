@@ -2,6 +2,7 @@
 Authentication API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from app.utils.database import get_db
@@ -19,7 +20,8 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 async def signup(user_create: UserCreate, db: Session = Depends(get_db)):
     """Create a new user account"""
     try:
-        user = UserService.create_user(db, user_create)
+        # bcrypt hashing is CPU-bound; keep it off the event loop
+        user = await run_in_threadpool(UserService.create_user, db, user_create)
         logger.info(f"User signed up: {user.email}")
         return user
     except DuplicateError as e:
@@ -37,7 +39,10 @@ async def signup(user_create: UserCreate, db: Session = Depends(get_db)):
 async def login(user_login: UserLogin, db: Session = Depends(get_db)):
     """Authenticate user and return access token"""
     try:
-        user = UserService.authenticate_user(db, user_login.email, user_login.password)
+        # bcrypt verification is CPU-bound; keep it off the event loop
+        user = await run_in_threadpool(
+            UserService.authenticate_user, db, user_login.email, user_login.password
+        )
         access_token = create_access_token({"sub": user.email, "user_id": user.id})
         logger.info(f"User logged in: {user.email}")
         return {"access_token": access_token, "token_type": "bearer"}
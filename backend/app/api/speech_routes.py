@@ -33,7 +33,7 @@ async def transcribe_audio_file(
             raise HTTPException(status_code=400, detail="No audio data provided")
         
         # Validate audio
-        if not await speech_recognizer.validate_audio(audio_data):
+        if not speech_recognizer.validate_audio(audio_data):
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid audio. Duration must be between 1-120 seconds"
@@ -2,14 +2,26 @@
 Error Handler - Centralized error management with graceful degradation and fallback responses.
 Provides comprehensive error handling for enterprise-grade reliability.
 """
-from typing import Dict, Any, Optional, Callable, Type, List, Tuple
+from typing import Dict, Any, Optional, Callable, Type, List, Tuple, Deque
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
+import atexit
+import bisect
 import logging
+import sqlite3
+import threading
+import time
 import traceback
+from collections import Counter, deque
 from datetime import datetime
 import json
-from functools import wraps
+from functools import singledispatch, wraps
+from itertools import islice
+
+from pydantic import ValidationError as PydanticValidationError
+
+from app.utils.exceptions import AuthenticationError, AuthorizationError, LLMError, ValidationError
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +49,139 @@ class ErrorCategory(str, Enum):
     UNKNOWN = "unknown"        # Unclassified errors
 
 
+def _build_exception_lookup(by_type: Dict[type, Any], by_name: Dict[str, Any]) -> Callable:
+    """
+    Build a singledispatch lookup from exception classes to values.
+    
+    Registered classes also match their subclasses. Exceptions with no
+    registered class in their MRO fall back to a match on the class name,
+    which covers third-party errors this module does not import.
+    """
+    @singledispatch
+    def lookup(exception: BaseException) -> Any:
+        return by_name.get(type(exception).__name__)
+    
+    for exception_type, value in by_type.items():
+        lookup.register(exception_type, lambda exception, _value=value: _value)
+    
+    return lookup
+
+
+# Exception type -> severity, used by ErrorHandler._determine_severity
+_severity_for = _build_exception_lookup(
+    {
+        # Low severity - minor issues
+        ValueError: ErrorSeverity.LOW,
+        TypeError: ErrorSeverity.LOW,
+        AttributeError: ErrorSeverity.LOW,
+        
+        # Medium severity - significant issues
+        TimeoutError: ErrorSeverity.MEDIUM,
+        ConnectionError: ErrorSeverity.MEDIUM,
+        ValidationError: ErrorSeverity.MEDIUM,
+        PydanticValidationError: ErrorSeverity.MEDIUM,
+        
+        # High severity - critical issues
+        RuntimeError: ErrorSeverity.HIGH,
+        MemoryError: ErrorSeverity.HIGH,
+        sqlite3.DatabaseError: ErrorSeverity.HIGH,
+        
+        # Critical severity - system failures
+        SystemExit: ErrorSeverity.CRITICAL,
+        KeyboardInterrupt: ErrorSeverity.CRITICAL,
+    },
+    {
+        "ValidationError": ErrorSeverity.MEDIUM,
+        "DatabaseError": ErrorSeverity.HIGH,
+    }
+)
+
+
+# Exception type -> category, used by ErrorHandler._determine_category
+_category_for = _build_exception_lookup(
+    {
+        # Validation errors
+        ValidationError: ErrorCategory.VALIDATION,
+        PydanticValidationError: ErrorCategory.VALIDATION,
+        ValueError: ErrorCategory.VALIDATION,
+        TypeError: ErrorCategory.VALIDATION,
+        
+        # Authentication/Authorization
+        AuthenticationError: ErrorCategory.AUTHENTICATION,
+        AuthorizationError: ErrorCategory.AUTHORIZATION,
+        
+        # Network/Timeout
+        TimeoutError: ErrorCategory.TIMEOUT,
+        ConnectionError: ErrorCategory.NETWORK,
+        
+        # External services
+        LLMError: ErrorCategory.EXTERNAL,
+        
+        # Resource issues
+        MemoryError: ErrorCategory.RESOURCE,
+    },
+    {
+        "ValidationError": ErrorCategory.VALIDATION,
+        "AuthenticationError": ErrorCategory.AUTHENTICATION,
+        "AuthorizationError": ErrorCategory.AUTHORIZATION,
+        "NetworkError": ErrorCategory.NETWORK,
+        "LLMError": ErrorCategory.EXTERNAL,
+        "ExternalServiceError": ErrorCategory.EXTERNAL,
+        "ResourceExhausted": ErrorCategory.RESOURCE,
+    }
+)
+
+
+# Default fallback payloads keyed by operation name
+_DEFAULT_FALLBACKS = MappingProxyType({
+    "question_generation": {
+        "question": "Tell me about your experience with the technologies relevant to this role.",
+        "category": "Behavioral",
+        "difficulty": "medium",
+        "estimated_time": 120
+    },
+    "answer_evaluation": {
+        "score": 5.0,
+        "feedback": "Unable to evaluate at this time. Please try again.",
+        "strengths": ["Response received"],
+        "weaknesses": ["Evaluation temporarily unavailable"]
+    },
+    "interview_completion": {
+        "status": "completed",
+        "message": "Interview completed with system limitations",
+        "scores": [5.0] * 3  # Default scores
+    }
+})
+
+
+# Recovery action suggestions keyed by error category
+_RECOVERY_SUGGESTIONS = MappingProxyType({
+    ErrorCategory.NETWORK: "Check network connectivity and retry the operation",
+    ErrorCategory.TIMEOUT: "Increase timeout duration or retry with exponential backoff",
+    ErrorCategory.EXTERNAL: "Verify external service status and retry after brief delay",
+    ErrorCategory.RESOURCE: "Free up system resources and retry operation",
+    ErrorCategory.VALIDATION: "Correct input data and resubmit request",
+    ErrorCategory.AUTHENTICATION: "Verify credentials and authentication tokens",
+    ErrorCategory.AUTHORIZATION: "Check user permissions and access rights",
+    ErrorCategory.INTERNAL: "Contact system administrator for assistance",
+})
+
+
+# Retry policy sets consulted by ErrorHandler.should_retry
+_NO_RETRY_SEVERITIES = frozenset({ErrorSeverity.CRITICAL, ErrorSeverity.HIGH})
+_NO_RETRY_CATEGORIES = frozenset({ErrorCategory.VALIDATION, ErrorCategory.AUTHENTICATION})
+_RETRY_CATEGORIES = frozenset({ErrorCategory.NETWORK, ErrorCategory.TIMEOUT, ErrorCategory.EXTERNAL})
+
+
+# Logging level used for each severity in ErrorHandler._log_error
+_LOG_LEVEL_FOR_SEVERITY = MappingProxyType({
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.LOW: logging.INFO,
+})
+
+
 @dataclass
 class ErrorContext:
     """Context information for error handling."""
@@ -90,6 +235,11 @@ class ErrorReport:
         return json.dumps(self.to_dict(), indent=2)
 
 
+def _report_timestamp(error_report: "ErrorReport") -> datetime:
+    """Sort key used to bisect the time-ordered recent errors list."""
+    return error_report.timestamp
+
+
 class FallbackResponse:
     """Standardized fallback response structure."""
     
@@ -121,9 +271,16 @@ class ErrorHandler:
     
     def __init__(self):
         self.error_counts: Dict[ErrorCategory, int] = {}
-        self.recent_errors: List[ErrorReport] = []
         self.max_recent_errors = 100
+        self.recent_errors: Deque[ErrorReport] = deque(maxlen=self.max_recent_errors)
         self.fallback_handlers: Dict[str, Callable] = {}
+        # Identical errors within this window are counted instead of recorded
+        self.dedup_window_seconds = 1.0
+        self._burst_counts: Dict[Tuple[str, str, ErrorCategory], List] = {}
+        # Logs the rollup once a burst's window closes, even if the error
+        # never recurs; only scheduled while something is suppressed
+        self._burst_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
     
     def register_fallback_handler(self, operation_name: str, handler: Callable):
         """Register a fallback handler for an operation."""
@@ -148,6 +305,9 @@ class ErrorHandler:
         Returns:
             ErrorReport with structured information
         """
+        # Single timestamp shared by the error ID and the report
+        now = datetime.now()
+        
         # Determine error characteristics
         error_type = type(exception).__name__
         error_message = str(exception)
@@ -155,11 +315,25 @@ class ErrorHandler:
         category = self._determine_category(exception, default_category)
         
         # Generate error ID
-        error_id = f"{context.operation}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(str(exception)) % 10000:04d}"
+        error_id = f"{context.operation}_{now.strftime('%Y%m%d_%H%M%S')}_{hash(error_message) % 10000:04d}"
+        
+        # Repeats of an error already reported in this window only bump counters
+        if self._coalesce_burst((context.operation, error_type, category)):
+            self._update_metrics(category)
+            return ErrorReport(
+                error_id=error_id,
+                error_type=error_type,
+                error_message=error_message,
+                severity=severity,
+                category=category,
+                context=context,
+                affected_components=[context.operation],
+                timestamp=now
+            )
         
         # Capture stack trace for internal errors
         stack_trace = None
-        if category == ErrorCategory.INTERNAL:
+        if category is ErrorCategory.INTERNAL:
             stack_trace = traceback.format_exc()
         
         # Create error report
@@ -171,7 +345,8 @@ class ErrorHandler:
             category=category,
             context=context,
             stack_trace=stack_trace,
-            affected_components=[context.operation]
+            affected_components=[context.operation],
+            timestamp=now
         )
         
         # Update metrics
@@ -183,82 +358,104 @@ class ErrorHandler:
         
         return error_report
     
+    def _coalesce_burst(self, key: Tuple[str, str, ErrorCategory]) -> bool:
+        """
+        Track repeated (operation, error type, category) occurrences.
+        
+        Returns True when an identical error was already reported within the
+        dedup window. When a new window opens, the number of occurrences
+        suppressed during the previous one is logged as a single rollup.
+        """
+        now = time.monotonic()
+        with self._burst_lock:
+            entry = self._burst_counts.get(key)
+            if entry is not None and now - entry[0] < self.dedup_window_seconds:
+                entry[1] += 1
+                self._schedule_flush()
+                return True
+            # Closed windows are dropped here too, so keys that never repeat
+            # do not wait for a timer that is only started by duplicates
+            self._drop_expired_bursts(now)
+            self._burst_counts[key] = [now, 0]
+        return False
+    
+    def _drop_expired_bursts(self, now: float):
+        """
+        Log and drop bursts whose window has closed; caller holds the lock.
+        
+        Entries are only ever added at the end with the current time, so the
+        dict is ordered by window start and the scan stops at the first open one.
+        """
+        while self._burst_counts:
+            key, entry = next(iter(self._burst_counts.items()))
+            if now - entry[0] < self.dedup_window_seconds:
+                break
+            del self._burst_counts[key]
+            if entry[1]:
+                self._log_suppressed(key, entry[1])
+    
+    def _schedule_flush(self):
+        """Start the rollup timer unless one is pending; caller holds the lock."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.dedup_window_seconds, self._flush_expired_bursts)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush_expired_bursts(self):
+        """Timer callback: log and drop bursts whose window has closed."""
+        with self._burst_lock:
+            self._flush_timer = None
+            self._drop_expired_bursts(time.monotonic())
+            if any(entry[1] for entry in self._burst_counts.values()):
+                self._schedule_flush()
+    
+    def _log_suppressed(self, key: Tuple[str, str, ErrorCategory], count: int):
+        """Log one aggregate line for coalesced duplicate errors."""
+        operation, error_type, category = key
+        logger.warning(
+            "%s in %s: %d duplicate occurrences suppressed within %gs",
+            error_type, operation, count, self.dedup_window_seconds,
+            extra={"operation": operation, "category": category.value, "suppressed_count": count}
+        )
+    
+    def flush_suppressed_errors(self):
+        """Log rollups for all pending coalesced errors and reset their counters."""
+        with self._burst_lock:
+            for key, entry in self._burst_counts.items():
+                if entry[1]:
+                    self._log_suppressed(key, entry[1])
+                    entry[1] = 0
+    
     def _determine_severity(self, exception: Exception, default: ErrorSeverity) -> ErrorSeverity:
         """Determine error severity based on exception type."""
-        severity_mapping = {
-            # Low severity - minor issues
-            "ValueError": ErrorSeverity.LOW,
-            "TypeError": ErrorSeverity.LOW,
-            "AttributeError": ErrorSeverity.LOW,
-            
-            # Medium severity - significant issues
-            "TimeoutError": ErrorSeverity.MEDIUM,
-            "ConnectionError": ErrorSeverity.MEDIUM,
-            "ValidationError": ErrorSeverity.MEDIUM,
-            
-            # High severity - critical issues
-            "RuntimeError": ErrorSeverity.HIGH,
-            "MemoryError": ErrorSeverity.HIGH,
-            "DatabaseError": ErrorSeverity.HIGH,
-            
-            # Critical severity - system failures
-            "SystemExit": ErrorSeverity.CRITICAL,
-            "KeyboardInterrupt": ErrorSeverity.CRITICAL,
-        }
-        
-        return severity_mapping.get(type(exception).__name__, default)
+        severity = _severity_for(exception)
+        return default if severity is None else severity
     
     def _determine_category(self, exception: Exception, default: ErrorCategory) -> ErrorCategory:
         """Determine error category based on exception type."""
-        category_mapping = {
-            # Validation errors
-            "ValidationError": ErrorCategory.VALIDATION,
-            "ValueError": ErrorCategory.VALIDATION,
-            "TypeError": ErrorCategory.VALIDATION,
-            
-            # Authentication/Authorization
-            "AuthenticationError": ErrorCategory.AUTHENTICATION,
-            "AuthorizationError": ErrorCategory.AUTHORIZATION,
-            
-            # Network/Timeout
-            "TimeoutError": ErrorCategory.TIMEOUT,
-            "ConnectionError": ErrorCategory.NETWORK,
-            "NetworkError": ErrorCategory.NETWORK,
-            
-            # External services
-            "LLMError": ErrorCategory.EXTERNAL,
-            "ExternalServiceError": ErrorCategory.EXTERNAL,
-            
-            # Resource issues
-            "MemoryError": ErrorCategory.RESOURCE,
-            "ResourceExhausted": ErrorCategory.RESOURCE,
-        }
-        
-        return category_mapping.get(type(exception).__name__, default)
+        category = _category_for(exception)
+        return default if category is None else category
     
     def _update_metrics(self, category: ErrorCategory):
         """Update error metrics."""
         self.error_counts[category] = self.error_counts.get(category, 0) + 1
     
     def _add_to_recent_errors(self, error_report: ErrorReport):
-        """Add error to recent errors list."""
+        """Add error to recent errors; the bounded deque drops the oldest."""
         self.recent_errors.append(error_report)
-        if len(self.recent_errors) > self.max_recent_errors:
-            self.recent_errors.pop(0)  # Remove oldest error
     
     def _log_error(self, error_report: ErrorReport):
         """Log error with appropriate level based on severity."""
+        level = _LOG_LEVEL_FOR_SEVERITY.get(error_report.severity, logging.INFO)
+        # Skip serializing the report when the record would be filtered anyway
+        if not logger.isEnabledFor(level):
+            return
+        
         log_message = f"Error {error_report.error_id}: {error_report.error_type} - {error_report.error_message}"
-        context_data = error_report.context.to_dict()
-        
-        if error_report.severity == ErrorSeverity.CRITICAL:
-            logger.critical(log_message, extra={"error_report": error_report.to_dict(), "context": context_data})
-        elif error_report.severity == ErrorSeverity.HIGH:
-            logger.error(log_message, extra={"error_report": error_report.to_dict(), "context": context_data})
-        elif error_report.severity == ErrorSeverity.MEDIUM:
-            logger.warning(log_message, extra={"error_report": error_report.to_dict(), "context": context_data})
-        else:
-            logger.info(log_message, extra={"error_report": error_report.to_dict(), "context": context_data})
+        # Structured extras; the report already embeds the context, so both
+        # share one dict and formatters serialize it only when they emit
+        report_data = error_report.to_dict()
+        logger.log(level, log_message, extra={"error_report": report_data, "context": report_data["context"]})
     
     def get_fallback_response(
         self,
@@ -289,27 +486,12 @@ class ErrorHandler:
                 logger.warning(f"Custom fallback handler failed for {operation_name}: {str(e)}")
         
         # Default fallback responses based on operation type
-        default_fallbacks = {
-            "question_generation": {
-                "question": "Tell me about your experience with the technologies relevant to this role.",
-                "category": "Behavioral",
-                "difficulty": "medium",
-                "estimated_time": 120
-            },
-            "answer_evaluation": {
-                "score": 5.0,
-                "feedback": "Unable to evaluate at this time. Please try again.",
-                "strengths": ["Response received"],
-                "weaknesses": ["Evaluation temporarily unavailable"]
-            },
-            "interview_completion": {
-                "status": "completed",
-                "message": "Interview completed with system limitations",
-                "scores": [5.0] * 3  # Default scores
-            }
-        }
-        
-        fallback_data = default_fallbacks.get(operation_name, default_response)
+        fallback_data = _DEFAULT_FALLBACKS.get(operation_name)
+        if fallback_data is None:
+            fallback_data = default_response
+        else:
+            # Hand out a shallow copy so callers cannot mutate the shared table
+            fallback_data = dict(fallback_data)
         
         return FallbackResponse(
             data=fallback_data,
@@ -318,55 +500,56 @@ class ErrorHandler:
     
     def should_retry(self, error_report: ErrorReport) -> bool:
         """Determine if operation should be retried based on error."""
-        # Don't retry critical errors or validation errors
-        if error_report.severity in [ErrorSeverity.CRITICAL, ErrorSeverity.HIGH]:
-            return False
+        severity = error_report.severity
+        category = error_report.category
         
-        if error_report.category in [ErrorCategory.VALIDATION, ErrorCategory.AUTHENTICATION]:
+        # Don't retry critical errors or validation errors
+        if severity in _NO_RETRY_SEVERITIES or category in _NO_RETRY_CATEGORIES:
             return False
         
         # Retry network, timeout, and external service errors
-        if error_report.category in [ErrorCategory.NETWORK, ErrorCategory.TIMEOUT, ErrorCategory.EXTERNAL]:
+        if category in _RETRY_CATEGORIES:
             return True
         
         # Retry medium severity internal errors
-        if error_report.severity == ErrorSeverity.MEDIUM and error_report.category == ErrorCategory.INTERNAL:
-            return True
-        
-        return False
+        return severity is ErrorSeverity.MEDIUM and category is ErrorCategory.INTERNAL
     
     def get_recovery_suggestion(self, error_report: ErrorReport) -> str:
         """Get recovery action suggestion for an error."""
-        suggestions = {
-            ErrorCategory.NETWORK: "Check network connectivity and retry the operation",
-            ErrorCategory.TIMEOUT: "Increase timeout duration or retry with exponential backoff",
-            ErrorCategory.EXTERNAL: "Verify external service status and retry after brief delay",
-            ErrorCategory.RESOURCE: "Free up system resources and retry operation",
-            ErrorCategory.VALIDATION: "Correct input data and resubmit request",
-            ErrorCategory.AUTHENTICATION: "Verify credentials and authentication tokens",
-            ErrorCategory.AUTHORIZATION: "Check user permissions and access rights",
-            ErrorCategory.INTERNAL: "Contact system administrator for assistance",
-        }
-        
-        return suggestions.get(error_report.category, "Review error details and take appropriate action")
+        return _RECOVERY_SUGGESTIONS.get(error_report.category, "Review error details and take appropriate action")
     
     def get_system_health(self) -> Dict[str, Any]:
         """Get current system health status based on recent errors."""
+        self.flush_suppressed_errors()
+        
         if not self.recent_errors:
             return {"status": "healthy", "error_rate": 0.0, "message": "No recent errors"}
         
+        # Single pass over the last 10 errors collecting counts and time span
+        total = len(self.recent_errors)
+        recent_count = 0
+        critical_errors = 0
+        high_errors = 0
+        first_timestamp = last_timestamp = None
+        for error in islice(self.recent_errors, max(0, total - 10), total):
+            recent_count += 1
+            severity = error.severity
+            if severity is ErrorSeverity.CRITICAL:
+                critical_errors += 1
+            elif severity is ErrorSeverity.HIGH:
+                high_errors += 1
+            if first_timestamp is None:
+                first_timestamp = error.timestamp
+            last_timestamp = error.timestamp
+        
         # Calculate error rate (errors per minute)
-        recent_errors = self.recent_errors[-10:]  # Last 10 errors
-        if len(recent_errors) < 2:
+        if recent_count < 2:
             error_rate = 0.0
         else:
-            time_span = (recent_errors[-1].timestamp - recent_errors[0].timestamp).total_seconds() / 60
-            error_rate = len(recent_errors) / max(1.0, time_span)
+            time_span = (last_timestamp - first_timestamp).total_seconds() / 60
+            error_rate = recent_count / max(1.0, time_span)
         
         # Determine health status
-        critical_errors = sum(1 for e in recent_errors if e.severity == ErrorSeverity.CRITICAL)
-        high_errors = sum(1 for e in recent_errors if e.severity == ErrorSeverity.HIGH)
-        
         if critical_errors > 0:
             status = "critical"
             message = f"Critical errors detected: {critical_errors}"
@@ -378,13 +561,13 @@ class ErrorHandler:
             message = f"Elevated error rate: {error_rate:.2f} errors/minute"
         else:
             status = "healthy"
-            message = f"Normal operation with {len(recent_errors)} recent errors"
+            message = f"Normal operation with {recent_count} recent errors"
         
         return {
             "status": status,
             "error_rate": round(error_rate, 2),
-            "total_errors": len(self.recent_errors),
-            "recent_error_count": len(recent_errors),
+            "total_errors": total,
+            "recent_error_count": recent_count,
             "critical_errors": critical_errors,
             "high_severity_errors": high_errors,
             "category_breakdown": {
@@ -395,33 +578,37 @@ class ErrorHandler:
     
     def get_error_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get error summary for specified time period."""
+        self.flush_suppressed_errors()
+        
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        period_errors = [e for e in self.recent_errors if e.timestamp >= cutoff_time]
+        
+        # recent_errors is appended in timestamp order, so bisect to the cutoff
+        start = bisect.bisect_left(self.recent_errors, cutoff_time, key=_report_timestamp)
+        period_errors = list(islice(self.recent_errors, start, None))
         
         if not period_errors:
             return {"message": f"No errors in the last {hours} hours"}
         
-        # Group by category and severity
-        category_counts = {}
-        severity_counts = {}
+        # Group by category, severity and type in a single pass
+        category_counts = Counter()
+        severity_counts = Counter()
+        error_types = Counter()
         
+        # Count on the enum members; .value is resolved once per distinct key below
         for error in period_errors:
-            category_counts[error.category.value] = category_counts.get(error.category.value, 0) + 1
-            severity_counts[error.severity.value] = severity_counts.get(error.severity.value, 0) + 1
+            category_counts[error.category] += 1
+            severity_counts[error.severity] += 1
+            error_types[error.error_type] += 1
         
         # Most common errors
-        error_types = {}
-        for error in period_errors:
-            error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
-        
-        most_common = sorted(error_types.items(), key=lambda x: x[1], reverse=True)[:5]
+        most_common = error_types.most_common(5)
         
         return {
             "period_hours": hours,
             "total_errors": len(period_errors),
             "unique_error_types": len(error_types),
-            "category_distribution": category_counts,
-            "severity_distribution": severity_counts,
+            "category_distribution": {cat.value: count for cat, count in category_counts.items()},
+            "severity_distribution": {sev.value: count for sev, count in severity_counts.items()},
             "most_common_errors": [
                 {"type": error_type, "count": count} 
                 for error_type, count in most_common
@@ -433,6 +620,7 @@ class ErrorHandler:
 
 # Global error handler instance
 error_handler = ErrorHandler()
+atexit.register(error_handler.flush_suppressed_errors)
 
 
 # Convenience decorator for error handling
@@ -3,9 +3,14 @@ Production Error Handler for AI Interview Agent
 Graceful error handling with user-friendly messages and recovery options
 """
 import streamlit as st
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Tuple
+import asyncio
+import random
+import time
 import traceback
 from datetime import datetime
+from functools import wraps
+from types import MappingProxyType
 from .structured_logging import get_logger
 from ..components.ui_components import show_error, show_info_card
 
@@ -14,45 +19,45 @@ logger = get_logger(__name__)
 class ProductionErrorHandler:
     """Handles errors gracefully with user-friendly messaging"""
     
-    ERROR_TEMPLATES = {
-        "api_timeout": {
+    ERROR_TEMPLATES = MappingProxyType({
+        "api_timeout": MappingProxyType({
             "title": "Connection Timeout",
             "message": "The AI service is taking longer than expected to respond.",
             "solution": "Please check your internet connection and try again.",
             "retry_allowed": True
-        },
-        "api_unauthorized": {
+        }),
+        "api_unauthorized": MappingProxyType({
             "title": "Authentication Error",
             "message": "There was an issue connecting to the AI service.",
             "solution": "This has been logged and will be investigated.",
             "retry_allowed": False
-        },
-        "api_rate_limit": {
+        }),
+        "api_rate_limit": MappingProxyType({
             "title": "Service Busy",
             "message": "Too many requests are being processed right now.",
             "solution": "Please wait a moment and try again.",
             "retry_allowed": True,
             "delay_seconds": 30
-        },
-        "validation_error": {
+        }),
+        "validation_error": MappingProxyType({
             "title": "Input Error",
             "message": "There was an issue with the provided information.",
             "solution": "Please check your input and try again.",
             "retry_allowed": True
-        },
-        "network_error": {
+        }),
+        "network_error": MappingProxyType({
             "title": "Network Connection Issue",
             "message": "Unable to connect to the service.",
             "solution": "Please check your internet connection.",
             "retry_allowed": True
-        },
-        "generic": {
+        }),
+        "generic": MappingProxyType({
             "title": "Something Went Wrong",
             "message": "An unexpected error occurred.",
             "solution": "Our team has been notified and is working on it.",
             "retry_allowed": True
-        }
-    }
+        })
+    })
     
     @classmethod
     def handle_error(cls, error: Exception, context: str = "", user_friendly: bool = True):
@@ -113,7 +118,6 @@ class ProductionErrorHandler:
             with col2:
                 delay = template.get("delay_seconds", 5)
                 if st.button(f"🔄 Try Again (in {delay}s)", use_container_width=True):
-                    import time
                     with st.spinner(f"Retrying in {delay} seconds..."):
                         time.sleep(delay)
                     st.rerun()
@@ -127,12 +131,16 @@ class ProductionErrorHandler:
             cls.handle_error(e, error_context)
             return default_return
     
+    @staticmethod
+    def _backoff_schedule(max_retries: int, delay: float) -> Tuple[float, ...]:
+        """Precompute the exponential backoff delays for each retry attempt"""
+        return tuple(delay * (1 << attempt) for attempt in range(max_retries))
+    
     @classmethod
     def with_retry(cls, func: Callable, max_retries: int = 3, delay: float = 1.0, 
                    error_context: str = "") -> Callable:
         """Decorator for functions that should retry on failure"""
-        import time
-        from functools import wraps
+        backoff = cls._backoff_schedule(max_retries, delay)
         
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -144,7 +152,31 @@ class ProductionErrorHandler:
                     last_exception = e
                     if attempt < max_retries - 1:
                         logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                        time.sleep(delay * (2 ** attempt))  # Exponential backoff
+                        # Exponential backoff with jitter to avoid synchronized retries
+                        time.sleep(backoff[attempt] * random.uniform(0.8, 1.2))
+                    else:
+                        cls.handle_error(e, f"{error_context} (after {max_retries} attempts)")
+                        raise last_exception
+            return None
+        return wrapper
+    
+    @classmethod
+    def with_retry_async(cls, func: Callable, max_retries: int = 3, delay: float = 1.0,
+                         error_context: str = "") -> Callable:
+        """Decorator for coroutines that should retry on failure without blocking the event loop"""
+        backoff = cls._backoff_schedule(max_retries, delay)
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exception = None
+            for attempt in range(max_retries):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    last_exception = e
+                    if attempt < max_retries - 1:
+                        logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+                        await asyncio.sleep(backoff[attempt] * random.uniform(0.8, 1.2))
                     else:
                         cls.handle_error(e, f"{error_context} (after {max_retries} attempts)")
                         raise last_exception
@@ -182,13 +214,7 @@ class RecoveryManager:
     @staticmethod
     def offer_recovery_options(error_type: str):
         """Offer appropriate recovery options based on error type"""
-        recovery_options = {
-            "api_timeout": ["Retry connection", "Continue offline", "Contact support"],
-            "network_error": ["Check connection", "Retry", "Use cached data"],
-            "generic": ["Restart session", "Go to homepage", "Contact support"]
-        }
-        
-        options = recovery_options.get(error_type, recovery_options["generic"])
+        options = _RECOVERY_OPTIONS.get(error_type, _RECOVERY_OPTIONS["generic"])
         
         st.markdown("### Recovery Options")
         for i, option in enumerate(options, 1):
@@ -199,21 +225,49 @@ class RecoveryManager:
     def _execute_recovery(option: str):
         """Execute selected recovery action"""
         logger.info(f"Executing recovery: {option}")
-        
-        if "Restart session" in option:
-            st.session_state.clear()
-            st.rerun()
-        elif "Go to homepage" in option:
-            st.session_state.page = "home"
-            st.rerun()
-        elif "Retry" in option:
-            st.rerun()
-        else:
-            show_info_card(
-                "Support Contact",
-                "Please email support@interviewagent.com with details about your issue.",
-                icon="📧"
-            )
+        _RECOVERY_ACTIONS.get(option, _show_support_contact)()
+
+
+def _restart_session():
+    """Clear all session state and rerun"""
+    st.session_state.clear()
+    st.rerun()
+
+
+def _go_to_homepage():
+    """Navigate back to the home page"""
+    st.session_state.page = "home"
+    st.rerun()
+
+
+def _retry():
+    """Rerun the current page"""
+    st.rerun()
+
+
+def _show_support_contact():
+    """Show support contact details"""
+    show_info_card(
+        "Support Contact",
+        "Please email support@interviewagent.com with details about your issue.",
+        icon="📧"
+    )
+
+
+# Recovery options offered per classified error type
+_RECOVERY_OPTIONS = MappingProxyType({
+    "api_timeout": ("Retry connection", "Continue offline", "Contact support"),
+    "network_error": ("Check connection", "Retry", "Use cached data"),
+    "generic": ("Restart session", "Go to homepage", "Contact support")
+})
+
+# Option label -> recovery action; anything unlisted shows the support contact
+_RECOVERY_ACTIONS = MappingProxyType({
+    "Restart session": _restart_session,
+    "Go to homepage": _go_to_homepage,
+    "Retry connection": _retry,
+    "Retry": _retry,
+})
 
 # Convenience functions
 def handle_exception(error: Exception, context: str = ""):
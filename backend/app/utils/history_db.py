@@ -1,13 +1,81 @@
 """
 Persistent storage for interview history using SQLite.
 """
+import atexit
+import queue
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional fast encoder; fall back to the stdlib
+    orjson = None
+
+
+# Applied to every connection: fsync once per commit under WAL, keep temp
+# tables in memory, a 64MB page cache and a 256MB memory map for reads.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+
+_INTERVIEW_COLUMNS = (
+    "id", "session_id", "candidate_name", "role", "experience_level",
+    "company", "final_score", "total_questions", "strengths", "weaknesses",
+    "started_at", "ended_at", "created_at"
+)
+
+_QUESTION_COLUMNS = (
+    "id", "interview_id", "question_text", "question_type", "topic",
+    "answer", "score", "feedback", "strengths", "improvements"
+)
+
+_INTERVIEW_WITH_QUESTIONS_QUERY = f"""
+    SELECT {", ".join("i." + column for column in _INTERVIEW_COLUMNS)},
+           {", ".join("q." + column for column in _QUESTION_COLUMNS)}
+    FROM interviews i
+    LEFT JOIN interview_questions q ON q.interview_id = i.id
+    WHERE i.id = ?
+    ORDER BY q.id
+"""
+
+_EMPTY_JSON_LIST = "[]"
+
+
+def _dumps_list(value) -> str:
+    """Serialize a list column, skipping json for the common empty case."""
+    if not value:
+        return _EMPTY_JSON_LIST
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _loads_list(value) -> list:
+    """Deserialize a list column, skipping json for empty or NULL values."""
+    if not value or value == _EMPTY_JSON_LIST:
+        return []
+    return orjson.loads(value) if orjson is not None else json.loads(value)
+
+
+# Every statistic in one statement, tagged by kind and split apart in Python
+_PERFORMANCE_STATS_QUERY = """
+    SELECT 'total', NULL, COUNT(*), AVG(final_score) FROM interviews
+    UNION ALL
+    SELECT 'role', role, COUNT(*), AVG(final_score) FROM interviews GROUP BY role
+    UNION ALL
+    SELECT 'exp', experience_level, COUNT(*), AVG(final_score) FROM interviews GROUP BY experience_level
+"""
+
 
 class InterviewHistoryDB:
     """
@@ -15,53 +83,110 @@ class InterviewHistoryDB:
     Stores completed interviews with scores and feedback.
     """
     
-    def __init__(self, db_path: str = "interview_history.db"):
+    def __init__(self, db_path: str = "interview_history.db", read_pool_size: int = 4):
         self.db_path = db_path
+        # One long-lived writer connection, serialized across Streamlit threads
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        atexit.register(self.close)
         self.init_db()
+        
+        # Read-only connections; under WAL they read concurrently with the writer
+        self._read_pool: queue.LifoQueue = queue.LifoQueue(maxsize=read_pool_size)
+        for _ in range(read_pool_size):
+            self._read_pool.put(self._connect(read_only=True))
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with the per-connection performance PRAGMAs applied."""
+        if read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+    
+    @contextmanager
+    def _read(self):
+        """Check out a read-only connection from the pool."""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def close(self):
+        """Close the writer and all pooled reader connections."""
+        with self._lock:
+            self._conn.close()
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
     
     def init_db(self):
         """Initialize the database with required tables."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create interviews table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS interviews (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT UNIQUE,
-                candidate_name TEXT NOT NULL,
-                role TEXT NOT NULL,
-                experience_level TEXT NOT NULL,
-                company TEXT,
-                final_score REAL,
-                total_questions INTEGER,
-                strengths TEXT,
-                weaknesses TEXT,
-                started_at TIMESTAMP,
-                ended_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create questions table (for detailed tracking)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS interview_questions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                interview_id INTEGER,
-                question_text TEXT,
-                question_type TEXT,
-                topic TEXT,
-                answer TEXT,
-                score REAL,
-                feedback TEXT,
-                strengths TEXT,
-                improvements TEXT,
-                FOREIGN KEY (interview_id) REFERENCES interviews (id)
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            
+            # WAL is persistent in the database file, so it only needs setting once
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
+            # Create interviews table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS interviews (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT UNIQUE,
+                    candidate_name TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    experience_level TEXT NOT NULL,
+                    company TEXT,
+                    final_score REAL,
+                    total_questions INTEGER,
+                    strengths TEXT,
+                    weaknesses TEXT,
+                    started_at TIMESTAMP,
+                    ended_at TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Create questions table (for detailed tracking)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS interview_questions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    interview_id INTEGER,
+                    question_text TEXT,
+                    question_type TEXT,
+                    topic TEXT,
+                    answer TEXT,
+                    score REAL,
+                    feedback TEXT,
+                    strengths TEXT,
+                    improvements TEXT,
+                    FOREIGN KEY (interview_id) REFERENCES interviews (id)
+                )
+            """)
+            
+            # Indexes matching the lookups below, already in ORDER BY order
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS ix_interviews_created
+                ON interviews (created_at DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS ix_interviews_candidate_created
+                ON interviews (candidate_name, created_at DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS ix_interviews_role_created
+                ON interviews (role, created_at DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS ix_questions_interview
+                ON interview_questions (interview_id)
+            """)
     
     def save_interview(self, session_data: Dict[str, Any]) -> int:
         """
@@ -69,203 +194,164 @@ class InterviewHistoryDB:
         
         Args:
             session_data: Complete session data from orchestrator
-            
+        
         Returns:
             ID of the saved interview
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Insert main interview record
-        cursor.execute("""
-            INSERT INTO interviews (
-                session_id, candidate_name, role, experience_level, 
-                company, final_score, total_questions, 
-                strengths, weaknesses, started_at, ended_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            session_data.get("session_id"),
-            session_data.get("candidate_name"),
-            session_data.get("role"),
-            session_data.get("experience_level"),
-            session_data.get("company"),
-            session_data.get("average_score"),
-            session_data.get("current_question_num"),
-            json.dumps(session_data.get("strengths", [])),
-            json.dumps(session_data.get("weaknesses", [])),
-            session_data.get("started_at"),
-            session_data.get("ended_at")
-        ))
-        
-        interview_id = cursor.lastrowid
-        
-        # Insert question details if available
-        if "detailed_coverage" in session_data:
-            history = session_data.get("detailed_coverage", {}).get("history", [])
-            for item in history:
-                cursor.execute("""
+        # One transaction for the interview and all of its questions
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            
+            # Insert main interview record
+            cursor.execute("""
+                INSERT INTO interviews (
+                    session_id, candidate_name, role, experience_level, 
+                    company, final_score, total_questions, 
+                    strengths, weaknesses, started_at, ended_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                session_data.get("session_id"),
+                session_data.get("candidate_name"),
+                session_data.get("role"),
+                session_data.get("experience_level"),
+                session_data.get("company"),
+                session_data.get("average_score"),
+                session_data.get("current_question_num"),
+                _dumps_list(session_data.get("strengths")),
+                _dumps_list(session_data.get("weaknesses")),
+                session_data.get("started_at"),
+                session_data.get("ended_at")
+            ))
+            
+            interview_id = cursor.lastrowid
+            
+            # Insert question details if available, binding all rows in one batch
+            if "detailed_coverage" in session_data:
+                history = session_data.get("detailed_coverage", {}).get("history", [])
+                cursor.executemany("""
                     INSERT INTO interview_questions (
                         interview_id, question_text, question_type, topic,
                         answer, score, feedback, strengths, improvements
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    interview_id,
-                    item.get("question"),
-                    item.get("type"),
-                    item.get("topic"),
-                    item.get("answer"),
-                    item.get("score"),
-                    item.get("feedback"),
-                    json.dumps(item.get("strengths", [])),
-                    json.dumps(item.get("improvements", []))
-                ))
-        
-        conn.commit()
-        conn.close()
+                """, [
+                    (
+                        interview_id,
+                        item.get("question"),
+                        item.get("type"),
+                        item.get("topic"),
+                        item.get("answer"),
+                        item.get("score"),
+                        item.get("feedback"),
+                        _dumps_list(item.get("strengths")),
+                        _dumps_list(item.get("improvements"))
+                    )
+                    for item in history
+                ])
         
         return interview_id
     
     def get_all_interviews(self) -> List[Dict[str, Any]]:
         """Get all stored interviews with basic info."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT id, session_id, candidate_name, role, experience_level,
-                   company, final_score, total_questions, created_at
-            FROM interviews
-            ORDER BY created_at DESC
-        """)
-        
-        rows = cursor.fetchall()
-        columns = [description[0] for description in cursor.description]
-        
-        interviews = []
-        for row in rows:
-            interview = dict(zip(columns, row))
-            interviews.append(interview)
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, session_id, candidate_name, role, experience_level,
+                       company, final_score, total_questions, created_at
+                FROM interviews
+                ORDER BY created_at DESC
+            """)
+            
+            rows = cursor.fetchall()
         
-        conn.close()
-        return interviews
+        return [dict(row) for row in rows]
     
     def get_interview_by_id(self, interview_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed interview information by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Interview and its questions in one round trip; the interview
+        # columns repeat on every question row and are read from the first
+        with self._read() as conn:
+            rows = conn.execute(_INTERVIEW_WITH_QUESTIONS_QUERY, (interview_id,)).fetchall()
         
-        # Get main interview data
-        cursor.execute("""
-            SELECT * FROM interviews WHERE id = ?
-        """, (interview_id,))
-        
-        row = cursor.fetchone()
-        if not row:
-            conn.close()
+        if not rows:
             return None
         
-        columns = [description[0] for description in cursor.description]
-        interview = dict(zip(columns, row))
+        interview_width = len(_INTERVIEW_COLUMNS)
+        interview = dict(zip(_INTERVIEW_COLUMNS, rows[0][:interview_width]))
         
         # Parse JSON fields
-        interview["strengths"] = json.loads(interview.get("strengths", "[]"))
-        interview["weaknesses"] = json.loads(interview.get("weaknesses", "[]"))
-        
-        # Get detailed questions
-        cursor.execute("""
-            SELECT * FROM interview_questions WHERE interview_id = ?
-        """, (interview_id,))
-        
-        question_rows = cursor.fetchall()
-        question_columns = [description[0] for description in cursor.description]
+        interview["strengths"] = _loads_list(interview.get("strengths"))
+        interview["weaknesses"] = _loads_list(interview.get("weaknesses"))
         
         questions = []
-        for q_row in question_rows:
-            question = dict(zip(question_columns, q_row))
-            question["strengths"] = json.loads(question.get("strengths", "[]"))
-            question["improvements"] = json.loads(question.get("improvements", "[]"))
+        for row in rows:
+            # LEFT JOIN yields a single all-NULL question row when there are none
+            if row[interview_width] is None:
+                continue
+            question = dict(zip(_QUESTION_COLUMNS, row[interview_width:]))
+            question["strengths"] = _loads_list(question.get("strengths"))
+            question["improvements"] = _loads_list(question.get("improvements"))
             questions.append(question)
         
         interview["questions"] = questions
-        conn.close()
         
         return interview
     
     def get_interviews_by_candidate(self, candidate_name: str) -> List[Dict[str, Any]]:
         """Get all interviews for a specific candidate."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM interviews WHERE candidate_name = ?
-            ORDER BY created_at DESC
-        """, (candidate_name,))
-        
-        rows = cursor.fetchall()
-        columns = [description[0] for description in cursor.description]
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM interviews WHERE candidate_name = ?
+                ORDER BY created_at DESC
+            """, (candidate_name,))
+            
+            rows = cursor.fetchall()
         
         interviews = []
         for row in rows:
-            interview = dict(zip(columns, row))
-            interview["strengths"] = json.loads(interview.get("strengths", "[]"))
-            interview["weaknesses"] = json.loads(interview.get("weaknesses", "[]"))
+            interview = dict(row)
+            interview["strengths"] = _loads_list(interview.get("strengths"))
+            interview["weaknesses"] = _loads_list(interview.get("weaknesses"))
             interviews.append(interview)
         
-        conn.close()
         return interviews
     
     def get_interviews_by_role(self, role: str) -> List[Dict[str, Any]]:
         """Get all interviews for a specific role."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM interviews WHERE role = ?
-            ORDER BY created_at DESC
-        """, (role,))
-        
-        rows = cursor.fetchall()
-        columns = [description[0] for description in cursor.description]
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM interviews WHERE role = ?
+                ORDER BY created_at DESC
+            """, (role,))
+            
+            rows = cursor.fetchall()
         
         interviews = []
         for row in rows:
-            interview = dict(zip(columns, row))
-            interview["strengths"] = json.loads(interview.get("strengths", "[]"))
-            interview["weaknesses"] = json.loads(interview.get("weaknesses", "[]"))
+            interview = dict(row)
+            interview["strengths"] = _loads_list(interview.get("strengths"))
+            interview["weaknesses"] = _loads_list(interview.get("weaknesses"))
             interviews.append(interview)
         
-        conn.close()
         return interviews
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get overall performance statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total interviews
-        cursor.execute("SELECT COUNT(*) FROM interviews")
-        total_interviews = cursor.fetchone()[0]
-        
-        # Average score
-        cursor.execute("SELECT AVG(final_score) FROM interviews WHERE final_score IS NOT NULL")
-        avg_score = cursor.fetchone()[0]
-        
-        # By role
-        cursor.execute("""
-            SELECT role, COUNT(*), AVG(final_score)
-            FROM interviews
-            GROUP BY role
-        """)
-        role_stats = cursor.fetchall()
-        
-        # By experience level
-        cursor.execute("""
-            SELECT experience_level, COUNT(*), AVG(final_score)
-            FROM interviews
-            GROUP BY experience_level
-        """)
-        exp_stats = cursor.fetchall()
-        
-        conn.close()
+        with self._read() as conn:
+            rows = conn.execute(_PERFORMANCE_STATS_QUERY).fetchall()
+        
+        total_interviews, avg_score = 0, None
+        role_stats = []
+        exp_stats = []
+        for kind, key, count, average in rows:
+            if kind == 'total':
+                # AVG skips NULL scores, matching the old IS NOT NULL filter
+                total_interviews, avg_score = count, average
+            elif kind == 'role':
+                role_stats.append((key, count, average))
+            else:
+                exp_stats.append((key, count, average))
         
         return {
             "total_interviews": total_interviews,
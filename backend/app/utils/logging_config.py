@@ -1,10 +1,14 @@
 """
 Logging configuration for InterviewPilot
 """
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
+from typing import Optional
 
 # Create logs directory if it doesn't exist
 LOG_DIR = Path("./logs")
@@ -15,6 +19,94 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = os.getenv("LOG_FILE", "./logs/app.log")
 
 
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler for use behind a QueueListener.
+    
+    The stock handler stats the path, seeks, formats each record twice and
+    flushes on every record. This one tracks the file size itself, formats
+    once and leaves flushing to FlushingQueueListener, so a burst of records
+    reaches the disk in a few large writes instead of one syscall each.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        stream = super()._open()
+        stream.seek(0, os.SEEK_END)
+        self._size = stream.tell()
+        return stream
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes is a byte limit; non-ASCII text encodes to more bytes
+            # than characters
+            size = len(msg.encode(self.encoding or "utf-8", "replace"))
+            if self.stream is None:  # delay was set, or after a rollover
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry."""
+    
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            self.flush()
+        return self.queue.get(block)
+    
+    def flush(self):
+        """Flush every handler fed by this listener."""
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # Stream already closed (e.g. at interpreter exit); like
+                # logging.shutdown, never let a flush kill the listener
+                pass
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+    
+    The stock prepare() runs the handler's formatter on the calling thread and
+    folds the traceback into msg, so formatters behind the listener only see
+    one flat string. This resolves just the message and the traceback text on
+    the calling thread, which pins mutable args and releases the traceback's
+    frames, and leaves timestamps, layout and extra fields to the listener.
+    """
+    
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+_exc_formatter = logging.Formatter()
+
+
+# Background thread that drains queued records to the file/console handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
 def setup_logging():
     """Setup application logging configuration"""
     # Root logger
@@ -22,7 +114,7 @@ def setup_logging():
     root_logger.setLevel(getattr(logging, LOG_LEVEL))
 
     # File handler
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BatchedRotatingFileHandler(
         LOG_FILE,
         maxBytes=10485760,  # 10MB
         backupCount=10
@@ -42,13 +134,48 @@ def setup_logging():
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Callers only enqueue records; formatting and I/O happen on the
+    # listener thread so request paths never block on the log file
+    start_queue_logging(file_handler, console_handler)
 
     return root_logger
 
 
+def start_queue_logging(*handlers, filters=()):
+    """Route root logging through a queue drained by a background listener"""
+    global _queue_listener, _queue_handler
+    stop_logging()
+
+    log_queue = queue.Queue(-1)
+    _queue_handler = DeferredQueueHandler(log_queue)
+    for log_filter in filters:
+        _queue_handler.addFilter(log_filter)
+    _queue_listener = FlushingQueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    logging.getLogger().addHandler(_queue_handler)
+    return _queue_handler
+
+
+def stop_logging():
+    """Flush queued log records and stop the background listener"""
+    global _queue_listener, _queue_handler
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener.flush()
+        # Release the old file descriptors before setup_logging opens new ones
+        for handler in _queue_listener.handlers:
+            handler.close()
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_listener = None
+        _queue_handler = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance"""
     return logging.getLogger(name)
@@ -6,27 +6,28 @@ import streamlit as st
 from typing import Optional, Callable
 from .session_manager import SessionManager, get_session_info
 
+# Pages where leaving mid-interview loses progress
+_INTERVIEW_PAGES = frozenset({"interview", "results"})
+_ACTIVE_INTERVIEW_STATES = frozenset({"in_progress", "question_displayed"})
+
 class NavigationGuard:
     """Manages safe navigation with confirmation dialogs"""
     
     @staticmethod
     def check_interview_in_progress() -> bool:
         """Check if user is in the middle of an interview"""
-        session_state = get_session_info()
-        current_page = st.session_state.get("page", "")
-        
-        # Check if interview is active
-        interview_active = (
-            session_state.get("state") in ["in_progress", "question_displayed"] or
-            st.session_state.get("interview_active", False) or
-            st.session_state.get("current_question") is not None
-        )
+        ss = st.session_state
         
-        # Allow navigation away from interview pages only if not in progress
-        interview_pages = ["interview", "results"]
-        on_interview_page = current_page in interview_pages
+        # Only interview pages are guarded, so check the page first
+        if ss.get("page", "") not in _INTERVIEW_PAGES:
+            return False
         
-        return interview_active and on_interview_page
+        # Check if interview is active, cheapest lookups first
+        return (
+            ss.get("interview_active", False) or
+            ss.get("current_question") is not None or
+            get_session_info().get("state") in _ACTIVE_INTERVIEW_STATES
+        )
     
     @staticmethod
     def show_navigation_warning(target_page: str) -> bool:
@@ -92,12 +93,23 @@ class NavigationGuard:
 class UserActionTracker:
     """Tracks user actions for analytics and recovery"""
     
-    @staticmethod
-    def record_action(action: str, details: Optional[dict] = None):
+    # Only the most recent actions are kept. The list is trimmed in place
+    # once it overshoots by TRIM_BATCH, so trimming is not paid per action
+    MAX_USER_ACTIONS = 500
+    TRIM_BATCH = 50
+    # Actions are appended to the live session directly; the session is
+    # saved (and its backup snapshotted) once per SAVE_EVERY actions
+    SAVE_EVERY = 10
+    UNSAVED_KEY = "_unsaved_user_actions"
+    
+    @classmethod
+    def record_action(cls, action: str, details: Optional[dict] = None):
         """Record user action for session analytics"""
         session_data = get_session_info()
-        if "user_actions" not in session_data:
-            session_data["user_actions"] = []
+        user_actions = session_data.get("user_actions")
+        if not isinstance(user_actions, list):
+            user_actions = list(user_actions or ())
+            session_data["user_actions"] = user_actions
             
         action_record = {
             "action": action,
@@ -105,8 +117,15 @@ class UserActionTracker:
             "details": details or {}
         }
         
-        session_data["user_actions"].append(action_record)
-        SessionManager.update_state(user_actions=session_data["user_actions"])
+        user_actions.append(action_record)
+        if len(user_actions) > cls.MAX_USER_ACTIONS + cls.TRIM_BATCH:
+            del user_actions[:-cls.MAX_USER_ACTIONS]
+        
+        unsaved = st.session_state.get(cls.UNSAVED_KEY, 0) + 1
+        if unsaved >= cls.SAVE_EVERY:
+            SessionManager.update_state(user_actions=user_actions)
+            unsaved = 0
+        st.session_state[cls.UNSAVED_KEY] = unsaved
 
 # Convenience functions
 def check_navigation_safety(target_page: str) -> bool:
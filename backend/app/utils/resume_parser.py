@@ -1,13 +1,80 @@
 """
 Resume Parser - Extract skills and projects from PDF resumes.
 """
-import fitz  # PyMuPDF
-from typing import Dict, List, Optional
+import copy
+import hashlib
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
 import re
 import json
 from io import BytesIO
 
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_END_RE = re.compile(r'[.!?]')
+_PROJECT_KEYWORD_RE = re.compile(r'project|built|developed|created')
+_SUMMARY_START_RE = re.compile(r'summary|objective|about|profile')
+_SUMMARY_END_RE = re.compile(r'experience|education|skills|projects')
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+
+_EDUCATION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        r'(bs|b\.s\.|bachelor\'?s?)\s+(in|of)\s+([a-z\s]+?)(?:\s+(?:degree|major|field)|\s+from|\s+at)',
+        r'(ms|m\.s\.|master\'?s?)\s+(in|of)\s+([a-z\s]+?)(?:\s+(?:degree|major|field)|\s+from|\s+at)',
+        r'(phd|ph\.d\.|doctorate?)\s+(in|of)\s+([a-z\s]+?)(?:\s+(?:degree|major|field)|\s+from|\s+at)',
+        r'(degree|diploma|certificate)\s+(?:in|of)\s+([a-z\s]+?)(?:\s+(?:from|at)|\s+with)'
+    ]
+]
+
+# "6 years of experience", "6 years experience", "6 yrs of experience" or
+# "experience: 6 years" in one alternation
+_EXPERIENCE_RE = re.compile(
+    r'(\d+)\s+(?:years?\s+(?:of\s+)?|yrs?\s+of\s+)experience'
+    r'|experience:\s*(\d+)\s+years?'
+)
+
+# Common skill keywords by category (matched against lowercased text)
+_SKILL_KEYWORDS = MappingProxyType({
+    'programming_languages': (
+        ('python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby',
+         'go', 'rust', 'scala', 'kotlin', 'swift', 'objective-c'),
+        ('sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle'),
+        ('html', 'css', 'sass', 'less', 'bootstrap', 'tailwind', 'react', 'vue',
+         'angular', 'svelte', 'jquery'),
+        ('node.js', 'express', 'django', 'flask', 'spring boot', 'laravel', 'rails'),
+        ('docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'jenkins',
+         'git', 'github', 'gitlab'),
+        ('tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib'),
+        ('agile', 'scrum', 'kanban', 'jira', 'confluence', 'figma', 'adobe'),
+    ),
+    'technologies': (
+        ('linux', 'windows', 'macos', 'unix'),
+        ('api', 'rest', 'graphql', 'microservices', 'monolith'),
+        ('cloud', 'saas', 'paas', 'iaas', 'devops', 'ci/cd'),
+        ('machine learning', 'artificial intelligence', 'data science', 'big data', 'nlp'),
+        ('security', 'cybersecurity', 'encryption', 'oauth', 'ssl', 'tls'),
+    ),
+})
+
+# Each keyword with its category and word-boundary pattern; a plain substring
+# test rules most keywords out before any regex runs on the full text
+_SKILL_KEYWORD_PATTERNS: Tuple[Tuple[str, str, Pattern], ...] = tuple(
+    (keyword, category, re.compile(r'\b' + re.escape(keyword) + r'\b'))
+    for category, groups in _SKILL_KEYWORDS.items()
+    for group in groups
+    for keyword in group
+)
+
+# All keyword groups folded into one alternation so a single scan over a
+# short snippet finds every skill it mentions
+_SKILL_SCANNER = re.compile('|'.join(
+    r'\b(' + '|'.join(map(re.escape, group)) + r')\b'
+    for groups in _SKILL_KEYWORDS.values()
+    for group in groups
+))
+
+
 class ResumeParser:
     """
     Parses PDF resumes to extract skills and projects.
@@ -15,32 +82,17 @@ class ResumeParser:
     """
     
     def __init__(self):
-        # Common skill patterns
-        self.skill_patterns = {
-            'programming_languages': [
-                r'\b(python|java|javascript|typescript|c\+\+|c#|php|ruby|go|rust|scala|kotlin|swift|objective-c)\b',
-                r'\b(sql|mysql|postgresql|mongodb|redis|oracle)\b',
-                r'\b(html|css|sass|less|bootstrap|tailwind|react|vue|angular|svelte|jquery)\b',
-                r'\b(node\.js|express|django|flask|spring boot|laravel|rails)\b',
-                r'\b(docker|kubernetes|aws|azure|gcp|terraform|jenkins|git|github|gitlab)\b',
-                r'\b(tensorflow|pytorch|scikit-learn|pandas|numpy|matplotlib)\b',
-                r'\b(agile|scrum|kanban|jira|confluence|figma|adobe)\b',
-            ],
-            'technologies': [
-                r'\b(linux|windows|macos|unix)\b',
-                r'\b(api|rest|graphql|microservices|monolith)\b',
-                r'\b(cloud|saas|paas|iaas|devops|ci/cd)\b',
-                r'\b(machine learning|artificial intelligence|data science|big data|nlp)\b',
-                r'\b(security|cybersecurity|encryption|oauth|ssl|tls)\b',
-            ]
-        }
-        
         # Common section headers
         self.section_headers = [
             r'skills?', r'technical skills?', r'core competencies?', r'expertise',
             r'projects?', r'work experience?', r'education', r'certifications?',
             r'achievements?', r'publications?'
         ]
+        
+        # Recent parse results keyed on a digest of the PDF bytes, so
+        # re-uploads and retries of the same file skip PyMuPDF and the regexes
+        self.max_cached_results = 64
+        self._cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
     
     def parse_pdf_resume(self, pdf_bytes: bytes) -> Dict[str, any]:
         """
@@ -52,20 +104,38 @@ class ResumeParser:
         Returns:
             Dictionary with extracted information
         """
+        # Not a PDF: skip hashing and PyMuPDF setup entirely. Readers accept the
+        # header anywhere in the first 1KB, so don't insist on byte 0
+        if b"%PDF-" not in pdf_bytes[:1024]:
+            return self._get_empty_result()
+        
+        key = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            # Callers keep and edit the result per session, so never hand out
+            # the cached dict or its nested lists
+            return copy.deepcopy(cached)
+        
         try:
+            # PyMuPDF is heavy to load, so it is only imported once a PDF arrives
+            import fitz  # PyMuPDF
+            
             # Extract text from PDF
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                text = "".join(page.get_text("text") for page in doc)
             
             # Process the text
-            return self._extract_information(text)
+            result = self._extract_information(text)
         
         except Exception as e:
             print(f"Error parsing PDF: {str(e)}")
             return self._get_empty_result()
+        
+        self._cache[key] = copy.deepcopy(result)
+        if len(self._cache) > self.max_cached_results:
+            self._cache.popitem(last=False)
+        return result
     
     def _get_empty_result(self) -> Dict[str, any]:
         """Return an empty result when parsing fails."""
@@ -82,7 +152,7 @@ class ResumeParser:
     def _extract_information(self, text: str) -> Dict[str, any]:
         """Extract information from resume text."""
         # Normalize text
-        text = re.sub(r'\s+', ' ', text.lower())
+        text = _WHITESPACE_RE.sub(' ', text.lower())
         
         # Extract skills
         skills = self._extract_skills(text)
@@ -100,29 +170,29 @@ class ResumeParser:
         summary = self._extract_summary(text)
         
         return {
-            "skills": list(set(skills["all_skills"])),
-            "programming_languages": list(set(skills["programming_languages"])),
-            "technologies": list(set(skills["technologies"])),
+            "skills": list(skills["all_skills"]),
+            "programming_languages": list(skills["programming_languages"]),
+            "technologies": list(skills["technologies"]),
             "projects": projects,
             "experience_years": experience_years,
             "education": education,
             "summary": summary
         }
     
-    def _extract_skills(self, text: str) -> Dict[str, List[str]]:
-        """Extract various types of skills."""
-        all_skills = []
-        programming_languages = []
-        technologies = []
-        
-        for category, patterns in self.skill_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
-                if category == 'programming_languages':
-                    programming_languages.extend(matches)
-                elif category == 'technologies':
-                    technologies.extend(matches)
-                all_skills.extend(matches)
+    def _extract_skills(self, text: str) -> Dict[str, Set[str]]:
+        """Extract various types of skills, deduplicated as they are found."""
+        all_skills = set()
+        programming_languages = set()
+        technologies = set()
+        
+        for skill, category, pattern in _SKILL_KEYWORD_PATTERNS:
+            if skill not in text or not pattern.search(text):
+                continue
+            if category == 'programming_languages':
+                programming_languages.add(skill)
+            elif category == 'technologies':
+                technologies.add(skill)
+            all_skills.add(skill)
         
         return {
             "all_skills": all_skills,
@@ -132,50 +202,52 @@ class ResumeParser:
     
     def _extract_projects(self, text: str) -> List[Dict[str, str]]:
         """Extract project information."""
-        # Look for common project indicators
-        project_keywords = [
-            r'project:', r'projects:', r'personal project', r'individual project',
-            r'academic project', r'course project', r'capstone project',
-            'built', 'developed', 'created', 'designed', 'engineered'
-        ]
-        
-        # Split text into sentences
-        sentences = re.split(r'[.!?]+', text)
-        
+        # Jump from one project keyword to the next and take the sentence
+        # around it (bounded to a window) instead of splitting the whole text
         projects = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(keyword in sentence for keyword in ['project', 'built', 'developed', 'created']):
-                if len(sentence) > 20:  # Meaningful project description
-                    projects.append({
-                        "description": sentence.capitalize(),
-                        "technologies_used": self._extract_technologies_from_sentence(sentence)
-                    })
-        
-        return projects[:5]  # Limit to top 5 projects
+        pos = 0
+        while len(projects) < 5:  # Limit to top 5 projects
+            match = _PROJECT_KEYWORD_RE.search(text, pos)
+            if match is None:
+                break
+            
+            window_start = max(0, match.start() - 80)
+            head = text[window_start:match.start()]
+            cut = max(head.rfind('.'), head.rfind('!'), head.rfind('?'))
+            if cut == -1 and window_start:
+                cut = head.find(' ')  # Don't start mid-word
+            start = window_start + cut + 1
+            
+            end_match = _SENTENCE_END_RE.search(text, match.end(), match.end() + 200)
+            if end_match:
+                end = end_match.start()
+            else:
+                end = min(len(text), match.end() + 200)
+                if end < len(text):
+                    end = max(text.rfind(' ', match.end(), end), match.end())
+            pos = end + 1
+            
+            sentence = text[start:end].strip()
+            if len(sentence) > 20:  # Meaningful project description
+                projects.append({
+                    "description": sentence.capitalize(),
+                    "technologies_used": self._extract_technologies_from_sentence(sentence)
+                })
+        
+        return projects
     
     def _extract_technologies_from_sentence(self, sentence: str) -> List[str]:
         """Extract technologies mentioned in a sentence."""
-        tech_list = []
-        for category, patterns in self.skill_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, sentence)
-                tech_list.extend(matches)
-        return list(set(tech_list))
+        return list({
+            match.group(match.lastindex)
+            for match in _SKILL_SCANNER.finditer(sentence)
+        })
     
     def _extract_education(self, text: str) -> List[str]:
         """Extract educational qualifications."""
-        # Look for education patterns
-        education_patterns = [
-            r'(bs|b\.s\.|bachelor\'?s?)\s+(in|of)\s+([a-z\s]+?)(?:\s+(?:degree|major|field)|\s+from|\s+at)',
-            r'(ms|m\.s\.|master\'?s?)\s+(in|of)\s+([a-z\s]+?)(?:\s+(?:degree|major|field)|\s+from|\s+at)',
-            r'(phd|ph\.d\.|doctorate?)\s+(in|of)\s+([a-z\s]+?)(?:\s+(?:degree|major|field)|\s+from|\s+at)',
-            r'(degree|diploma|certificate)\s+(?:in|of)\s+([a-z\s]+?)(?:\s+(?:from|at)|\s+with)'
-        ]
-        
         education = []
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _EDUCATION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 edu_str = ' '.join(match).strip()
                 if len(edu_str) > 5:  # Valid education string
@@ -186,24 +258,13 @@ class ResumeParser:
     def _estimate_experience(self, text: str) -> int:
         """Estimate years of experience."""
         # Look for experience indicators
-        experience_patterns = [
-            r'(\d+)\s+years?\s+of\s+experience',
-            r'(\d+)\s+years?\s+experience',
-            r'experience:\s*(\d+)\s+years?',
-            r'(\d+)\s+yrs?\s+of\s+experience'
-        ]
-        
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                try:
-                    return max(int(match) for match in matches)
-                except ValueError:
-                    pass
+        matches = _EXPERIENCE_RE.findall(text)
+        if matches:
+            return max(int(stated or labelled) for stated, labelled in matches)
         
         # Fallback: Look for years of experience in a general way
         # Count mentions of years in work-related context
-        year_mentions = re.findall(r'\b(\d{4})\b', text)
+        year_mentions = _YEAR_RE.findall(text)
         if len(year_mentions) >= 2:
             years = sorted([int(y) for y in year_mentions if 1950 < int(y) < 2030])
             if len(years) >= 2:
@@ -214,29 +275,19 @@ class ResumeParser:
     
     def _extract_summary(self, text: str) -> str:
         """Extract summary or objective section."""
-        # Look for summary/objective keywords
-        summary_start = -1
-        for keyword in ['summary', 'objective', 'about', 'profile']:
-            pos = text.find(keyword)
-            if pos != -1 and (summary_start == -1 or pos < summary_start):
-                summary_start = pos
-        
-        if summary_start != -1:
-            # Extract text around the summary section
-            start = max(0, summary_start - 100)
-            end = min(len(text), summary_start + 300)
-            summary_section = text[start:end]
-            
-            # Look for end markers
-            for end_marker in ['experience', 'education', 'skills', 'projects']:
-                end_pos = summary_section.find(end_marker)
-                if end_pos != -1:
-                    summary_section = summary_section[:end_pos]
-                    break
-            
-            return summary_section.strip().capitalize()
+        # Earliest summary/objective keyword
+        match = _SUMMARY_START_RE.search(text)
+        if match is None:
+            return ""
+        
+        # Extract text around the summary section, up to the first end marker
+        start = max(0, match.start() - 100)
+        end = min(len(text), match.start() + 300)
+        end_match = _SUMMARY_END_RE.search(text, start, end)
+        if end_match:
+            end = end_match.start()
         
-        return ""
+        return text[start:end].strip().capitalize()
 
 
 # Singleton instance
@@ -2,12 +2,14 @@
 Retry Handler - Enterprise-grade retry logic with exponential backoff and circuit breaker pattern.
 Provides robust error handling for LLM calls and external service interactions.
 """
-from typing import Dict, Any, Optional, Callable, Type, Tuple
+from typing import Dict, Any, Optional, Callable, FrozenSet, Type, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
 import time
 import random
+import threading
 from datetime import datetime, timedelta
 import logging
 from functools import wraps
@@ -42,24 +44,39 @@ class RetryConfig:
     exponential_base: float = 2.0
     jitter: bool = True
     timeout: Optional[float] = 30.0  # seconds
+    use_wait_for: bool = True  # False when the operation enforces its own timeout
     retryable_exceptions: Tuple[Type[Exception], ...] = (
         RetryableError,
         ConnectionError,
         TimeoutError,
         asyncio.TimeoutError,
     )
+    _delays: Tuple[float, ...] = field(default=(), init=False, repr=False, compare=False)
+    _retryable_types: FrozenSet[type] = field(default=frozenset(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Capped backoff for every attempt, computed once per config
+        self._delays = tuple(self._backoff(attempt) for attempt in range(self.max_attempts))
+        self._retryable_types = frozenset(self.retryable_exceptions)
+    
+    def is_retryable(self, error: BaseException) -> bool:
+        """Check whether an error (or any of its base classes) is retryable."""
+        # Hash lookups along the MRO instead of one subclass check per type
+        return not self._retryable_types.isdisjoint(type(error).__mro__)
+    
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff for an attempt, capped at max_delay."""
+        # Exponential backoff: base_delay * (exponential_base ^ attempt)
+        return min(self.base_delay * (self.exponential_base ** attempt), self.max_delay)
     
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt number."""
-        # Exponential backoff: base_delay * (exponential_base ^ attempt)
-        delay = self.base_delay * (self.exponential_base ** attempt)
+        delay = self._delays[attempt] if attempt < len(self._delays) else self._backoff(attempt)
         
-        # Cap at max_delay
-        delay = min(delay, self.max_delay)
-        
-        # Add jitter to prevent thundering herd
+        # Full jitter: spread retries uniformly over [0, delay] so clients
+        # that failed together don't come back together
         if self.jitter:
-            delay = delay * (0.5 + random.random() * 0.5)
+            delay = random.random() * delay
         
         return delay
 
@@ -71,6 +88,14 @@ class CircuitBreakerConfig:
     timeout: float = 60.0           # Time to stay open (seconds)
     success_threshold: int = 2      # Successes needed to close in half-open
     failure_window: float = 30.0    # Time window to count failures (seconds)
+    gradual_recovery: bool = True   # Ramp up admitted traffic while half-open
+
+
+def _monotonic_to_iso(timestamp: Optional[float]) -> Optional[str]:
+    """Convert a time.monotonic() reading to a wall-clock ISO string."""
+    if timestamp is None:
+        return None
+    return (datetime.now() - timedelta(seconds=time.monotonic() - timestamp)).isoformat()
 
 
 @dataclass
@@ -78,8 +103,9 @@ class CircuitMetrics:
     """Metrics for circuit breaker state."""
     failure_count: int = 0
     success_count: int = 0
-    last_failure_time: Optional[datetime] = None
-    last_success_time: Optional[datetime] = None
+    # time.monotonic() readings; converted to wall-clock only for reporting
+    last_failure_time: Optional[float] = None
+    last_success_time: Optional[float] = None
     state_changed_at: datetime = field(default_factory=datetime.now)
     
     def reset(self):
@@ -106,15 +132,21 @@ class CircuitBreaker:
         self.config = config
         self.state = CircuitState.CLOSED
         self.metrics = CircuitMetrics()
-        self._lock = asyncio.Lock()
+        # A threading.Lock rather than asyncio.Lock: breakers may be shared
+        # across threads and event loops, and no critical section awaits
+        self._lock = threading.Lock()
+        # Calls let through while HALF_OPEN, capped at success_threshold
+        self._probes_in_flight = 0
     
     def is_open(self) -> bool:
         """Check if circuit is open (fail-fast mode)."""
         if self.state == CircuitState.OPEN:
             # Check if timeout has expired
-            if (self.metrics.last_failure_time and 
-                datetime.now() - self.metrics.last_failure_time > timedelta(seconds=self.config.timeout)):
-                self._transition_to_half_open()
+            if (self.metrics.last_failure_time is not None and 
+                time.monotonic() - self.metrics.last_failure_time > self.config.timeout):
+                with self._lock:
+                    if self.state == CircuitState.OPEN:
+                        self._transition_to_half_open()
             return self.state == CircuitState.OPEN
         return False
     
@@ -141,9 +173,14 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or operation fails
         """
-        async with self._lock:
-            if not self.can_execute():
-                raise Exception(f"Circuit breaker '{self.name}' is OPEN - operation rejected")
+        # Reading the state is a single attribute load; only transitions lock
+        if not self.can_execute():
+            raise Exception(f"Circuit breaker '{self.name}' is OPEN - operation rejected")
+        
+        # While HALF_OPEN only a few probes run; the rest fail fast as if OPEN
+        probe = self.state is CircuitState.HALF_OPEN
+        if probe and not self._try_acquire_probe():
+            raise Exception(f"Circuit breaker '{self.name}' is OPEN - operation rejected")
         
         try:
             result = await operation(*args, **kwargs)
@@ -152,26 +189,51 @@ class CircuitBreaker:
         except Exception as e:
             await self._record_failure()
             raise e
+        finally:
+            if probe:
+                self._release_probe()
+    
+    def _recovery_probability(self) -> float:
+        """Share of HALF_OPEN calls admitted, ramping up with each success."""
+        return min(1.0, (self.metrics.success_count + 1) / self.config.success_threshold)
+    
+    def _try_acquire_probe(self) -> bool:
+        """Claim a HALF_OPEN probe slot without waiting."""
+        # Spread recovery traffic out instead of letting every caller back
+        # in at once the moment the circuit half-opens
+        if self.config.gradual_recovery and random.random() >= self._recovery_probability():
+            return False
+        with self._lock:
+            if self._probes_in_flight >= self.config.success_threshold:
+                return False
+            self._probes_in_flight += 1
+            return True
+    
+    def _release_probe(self):
+        """Return a HALF_OPEN probe slot."""
+        with self._lock:
+            self._probes_in_flight -= 1
     
     async def _record_success(self):
         """Record successful operation."""
-        async with self._lock:
+        with self._lock:
+            now = time.monotonic()
             self.metrics.success_count += 1
-            self.metrics.last_success_time = datetime.now()
+            self.metrics.last_success_time = now
             
             if self.state == CircuitState.HALF_OPEN:
                 if self.metrics.success_count >= self.config.success_threshold:
                     self._transition_to_closed()
             elif self.state == CircuitState.CLOSED:
                 # Reset failure count on success in closed state
-                if self._should_reset_failures():
+                if self._should_reset_failures(now):
                     self.metrics.failure_count = 0
     
     async def _record_failure(self):
         """Record failed operation."""
-        async with self._lock:
+        with self._lock:
             self.metrics.failure_count += 1
-            self.metrics.last_failure_time = datetime.now()
+            self.metrics.last_failure_time = time.monotonic()
             
             if self.state == CircuitState.HALF_OPEN:
                 self._transition_to_open()
@@ -184,10 +246,11 @@ class CircuitBreaker:
         old_state = self.state
         self.state = CircuitState.OPEN
         self.metrics.state_changed_at = datetime.now()
-        logger.warning(
-            f"Circuit breaker '{self.name}' transitioned from {old_state} to OPEN "
-            f"after {self.metrics.failure_count} failures"
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Circuit breaker '%s' transitioned from %s to OPEN after %d failures",
+                self.name, old_state, self.metrics.failure_count
+            )
     
     def _transition_to_half_open(self):
         """Transition circuit to HALF_OPEN state."""
@@ -195,28 +258,30 @@ class CircuitBreaker:
         self.state = CircuitState.HALF_OPEN
         self.metrics.success_count = 0  # Reset success count
         self.metrics.state_changed_at = datetime.now()
-        logger.info(
-            f"Circuit breaker '{self.name}' transitioned from {old_state} to HALF_OPEN "
-            f"after timeout period"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Circuit breaker '%s' transitioned from %s to HALF_OPEN after timeout period",
+                self.name, old_state
+            )
     
     def _transition_to_closed(self):
         """Transition circuit to CLOSED state."""
         old_state = self.state
         self.state = CircuitState.CLOSED
         self.metrics.reset()
-        logger.info(
-            f"Circuit breaker '{self.name}' transitioned from {old_state} to CLOSED "
-            f"after {self.metrics.success_count} successful operations"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Circuit breaker '%s' transitioned from %s to CLOSED after %d successful operations",
+                self.name, old_state, self.metrics.success_count
+            )
     
-    def _should_reset_failures(self) -> bool:
+    def _should_reset_failures(self, now: Optional[float] = None) -> bool:
         """Check if failure count should be reset based on time window."""
-        if not self.metrics.last_failure_time:
+        if self.metrics.last_failure_time is None:
             return True
         
-        time_since_failure = datetime.now() - self.metrics.last_failure_time
-        return time_since_failure > timedelta(seconds=self.config.failure_window)
+        time_since_failure = (now or time.monotonic()) - self.metrics.last_failure_time
+        return time_since_failure > self.config.failure_window
     
     def get_status(self) -> Dict[str, Any]:
         """Get current circuit breaker status."""
@@ -225,8 +290,8 @@ class CircuitBreaker:
             "state": self.state.value,
             "failure_count": self.metrics.failure_count,
             "success_count": self.metrics.success_count,
-            "last_failure": self.metrics.last_failure_time.isoformat() if self.metrics.last_failure_time else None,
-            "last_success": self.metrics.last_success_time.isoformat() if self.metrics.last_success_time else None,
+            "last_failure": _monotonic_to_iso(self.metrics.last_failure_time),
+            "last_success": _monotonic_to_iso(self.metrics.last_success_time),
             "state_changed_at": self.metrics.state_changed_at.isoformat(),
             "can_execute": self.can_execute()
         }
@@ -244,17 +309,28 @@ class RetryHandler:
     - Timeout handling
     """
     
+    # Least recently used breakers are dropped beyond this many names
+    MAX_CIRCUIT_BREAKERS = 1024
+    
     def __init__(self):
-        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.circuit_breakers: OrderedDict[str, CircuitBreaker] = OrderedDict()
+        self._registry_lock = threading.Lock()
         self.default_retry_config = RetryConfig()
         self.default_circuit_config = CircuitBreakerConfig()
     
     def get_circuit_breaker(self, name: str, config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
         """Get or create circuit breaker by name."""
-        if name not in self.circuit_breakers:
-            config = config or self.default_circuit_config
-            self.circuit_breakers[name] = CircuitBreaker(name, config)
-        return self.circuit_breakers[name]
+        # Lookup and insert under one lock so concurrent callers share a breaker
+        with self._registry_lock:
+            breaker = self.circuit_breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name, config or self.default_circuit_config)
+                self.circuit_breakers[name] = breaker
+                if len(self.circuit_breakers) > self.MAX_CIRCUIT_BREAKERS:
+                    self.circuit_breakers.popitem(last=False)
+            else:
+                self.circuit_breakers.move_to_end(name)
+            return breaker
     
     async def execute_with_retry(
         self,
@@ -284,59 +360,70 @@ class RetryHandler:
         """
         config = retry_config or self.default_retry_config
         
+        # Skip the wait_for wrapper entirely when the operation times itself out
+        timeout = config.timeout if config.use_wait_for else None
         last_exception = None
         
         for attempt in range(config.max_attempts):
+            # Check circuit breaker if provided; a closed circuit (the common
+            # case) needs no further check, and a rejected call is not a failure
+            if (circuit_breaker and circuit_breaker.state is not CircuitState.CLOSED
+                    and circuit_breaker.is_open()):
+                raise Exception(f"Circuit breaker '{circuit_breaker.name}' is OPEN")
+            
+            # A recovering circuit only lets a limited number of probes through
+            probe = circuit_breaker is not None and circuit_breaker.state is CircuitState.HALF_OPEN
+            if probe and not circuit_breaker._try_acquire_probe():
+                raise Exception(f"Circuit breaker '{circuit_breaker.name}' is OPEN")
+            
             try:
-                # Check circuit breaker if provided
-                if circuit_breaker and circuit_breaker.is_open():
-                    raise Exception(f"Circuit breaker '{circuit_breaker.name}' is OPEN")
-                
-                # Execute with timeout if specified
-                if config.timeout:
+                # Only wrap in wait_for (an extra Task and timer) when a
+                # timeout is configured; otherwise await the operation directly
+                if timeout:
                     result = await asyncio.wait_for(
                         operation(*args, **kwargs),
-                        timeout=config.timeout
+                        timeout=timeout
                     )
                 else:
                     result = await operation(*args, **kwargs)
                 
-                # Record success in circuit breaker
-                if circuit_breaker:
-                    await circuit_breaker._record_success()
-                
-                logger.info(f"{operation_name} succeeded on attempt {attempt + 1}")
-                return result
-                
-            except asyncio.TimeoutError as e:
-                logger.warning(f"{operation_name} timed out on attempt {attempt + 1}")
-                last_exception = e
-                if circuit_breaker:
-                    await circuit_breaker._record_failure()
-                
             except Exception as e:
-                logger.warning(f"{operation_name} failed on attempt {attempt + 1}: {str(e)}")
                 last_exception = e
                 
-                # Check if exception is retryable
-                if not isinstance(e, config.retryable_exceptions):
-                    logger.error(f"{operation_name} failed with non-retryable error: {str(e)}")
-                    if circuit_breaker:
-                        await circuit_breaker._record_failure()
-                    raise e
-                
-                # Record failure in circuit breaker
+                # Exactly one failure recorded per attempt
                 if circuit_breaker:
                     await circuit_breaker._record_failure()
                 
-                # Don't delay on final attempt
-                if attempt < config.max_attempts - 1:
-                    delay = config.get_delay(attempt)
-                    logger.info(f"Retrying {operation_name} in {delay:.2f} seconds...")
-                    await asyncio.sleep(delay)
+                if isinstance(e, asyncio.TimeoutError):
+                    logger.warning("%s timed out on attempt %d", operation_name, attempt + 1)
+                else:
+                    logger.warning("%s failed on attempt %d: %s", operation_name, attempt + 1, e)
+                    
+                    # Check if exception is retryable
+                    if not config.is_retryable(e):
+                        logger.error("%s failed with non-retryable error: %s", operation_name, e)
+                        raise e
+            
+            else:
+                # Record success in circuit breaker
+                if circuit_breaker:
+                    await circuit_breaker._record_success()
+                
+                logger.info("%s succeeded on attempt %d", operation_name, attempt + 1)
+                return result
+            
+            finally:
+                if probe:
+                    circuit_breaker._release_probe()
+            
+            # Don't delay on final attempt
+            if attempt < config.max_attempts - 1:
+                delay = config.get_delay(attempt)
+                logger.info("Retrying %s in %.2f seconds...", operation_name, delay)
+                await asyncio.sleep(delay)
         
         # All retries exhausted
-        logger.error(f"{operation_name} failed after {config.max_attempts} attempts")
+        logger.error("%s failed after %d attempts", operation_name, config.max_attempts)
         raise last_exception or Exception(f"{operation_name} failed after {config.max_attempts} attempts")
     
     def retry_decorator(
@@ -377,14 +464,15 @@ class RetryHandler:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get metrics for all circuit breakers."""
-        return {
-            name: breaker.get_status()
-            for name, breaker in self.circuit_breakers.items()
-        }
+        with self._registry_lock:
+            breakers = list(self.circuit_breakers.items())
+        return {name: breaker.get_status() for name, breaker in breakers}
     
     def reset_all_circuits(self):
         """Reset all circuit breakers to CLOSED state."""
-        for breaker in self.circuit_breakers.values():
+        with self._registry_lock:
+            breakers = list(self.circuit_breakers.values())
+        for breaker in breakers:
             breaker.state = CircuitState.CLOSED
             breaker.metrics.reset()
         logger.info("All circuit breakers reset to CLOSED state")
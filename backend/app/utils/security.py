@@ -2,8 +2,11 @@
 Security utilities for password hashing and JWT token generation
 """
 import os
-from datetime import datetime, timedelta
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -12,40 +15,60 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing; one shared context. Each bcrypt round doubles the cost,
+# and existing hashes keep verifying since their rounds are stored in them
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 security = HTTPBearer()
 
 # JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "120"))
+_DEFAULT_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Recently verified tokens -> (payload, expiry epoch seconds). A client sends
+# the same bearer token on every request, so repeats skip signature checks
+# and JSON parsing. Entries never outlive the token's own exp.
+TOKEN_CACHE_SIZE = 10_000
+TOKEN_CACHE_TTL = 60  # seconds
+_token_cache: OrderedDict[str, Tuple[dict, float]] = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _truncate_for_bcrypt(pwd_bytes: bytes) -> bytes:
+    """Cut an encoded password to bcrypt's 72-byte limit on a UTF-8 boundary"""
+    if len(pwd_bytes) <= 72:
+        return pwd_bytes
+    
+    # Back up to the start of any character straddling the limit
+    cut = 72
+    while (pwd_bytes[cut] & 0xC0) == 0x80:
+        cut -= 1
+    return pwd_bytes[:cut]
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt (truncated to 72 bytes)"""
     try:
-        # Bcrypt has a 72-byte limit, truncate to be safe
-        # Ensure we decode/encode properly to check byte length
+        # Bcrypt has a 72-byte limit; passlib takes the bytes as-is
         pwd_bytes = password.encode('utf-8')
         if len(pwd_bytes) > 72:
             logger.warning("Password longer than 72 bytes, truncating for bcrypt")
-            password = pwd_bytes[:72].decode('utf-8', errors='ignore')
-        return pwd_context.hash(password)
+            pwd_bytes = _truncate_for_bcrypt(pwd_bytes)
+        return pwd_context.hash(pwd_bytes)
     except Exception as e:
-        logger.error(f"Error hashing password: {str(e)}")
+        logger.error("Error hashing password: %s", e)
         raise
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
     try:
-        pwd_bytes = plain_password.encode('utf-8')
-        if len(pwd_bytes) > 72:
-            plain_password = pwd_bytes[:72].decode('utf-8', errors='ignore')
-        return pwd_context.verify(plain_password, hashed_password)
+        pwd_bytes = _truncate_for_bcrypt(plain_password.encode('utf-8'))
+        return pwd_context.verify(pwd_bytes, hashed_password)
     except Exception as e:
-        logger.error(f"Error verifying password: {str(e)}")
+        logger.error("Error verifying password: %s", e)
         return False
 
 
@@ -53,16 +76,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Create a JWT access token"""
     try:
         to_encode = data.copy()
-        # Use timezone-aware UTC for consistency
-        from datetime import timezone
-        now = datetime.now(timezone.utc)
-        
-        if expires_delta:
-            expire = now + expires_delta
-        else:
-            expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        
-        to_encode.update({"exp": expire})
+        # exp is plain epoch seconds (RFC 7519), which jose encodes as-is
+        expires_in = int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_EXPIRE_SECONDS
+        to_encode["exp"] = int(time.time()) + expires_in
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         
         # Ensure encoded_jwt is a string (python-jose returns a string, but some versions might return bytes)
@@ -70,18 +86,45 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
             return encoded_jwt.decode('utf-8')
         return encoded_jwt
     except Exception as e:
-        logger.error(f"Error creating access token: {str(e)}")
+        logger.error("Error creating access token: %s", e)
         raise
 
 
 def decode_token(token: str) -> Optional[dict]:
-    """Decode and verify a JWT token"""
+    """Decode and verify a JWT token; each call gets its own copy of the claims"""
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            if cached[1] > now:
+                _token_cache.move_to_end(token)
+                return dict(cached[0])
+            del _token_cache[token]
+    
     try:
+        # Stale tokens are common and can be turned away from the unverified
+        # claims alone; this is only ever used to reject, never to accept
+        exp = jwt.get_unverified_claims(token).get("exp")
+        if isinstance(exp, (int, float)) and exp < now:
+            logger.error("Error decoding token: Signature has expired.")
+            return None
+        
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError as e:
-        logger.error(f"Error decoding token: {str(e)}")
+        logger.error("Error decoding token: %s", e)
         return None
+    
+    # Only successful decodes are cached
+    expires_at = now + TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    with _token_cache_lock:
+        _token_cache[token] = (payload, expires_at)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    
+    return dict(payload)
 
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
@@ -101,7 +144,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error validating token: {str(e)}")
+        logger.error("Unexpected error validating token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
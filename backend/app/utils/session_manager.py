@@ -2,8 +2,8 @@
 Production Session Manager for AI Interview Agent
 Handles persistent state, recovery, and safe navigation
 """
-import json
-import hashlib
+import secrets
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 import streamlit as st
@@ -16,55 +16,75 @@ class SessionManager:
     
     SESSION_KEY = "interview_session_state"
     BACKUP_KEY = "interview_session_backup"
+    LAST_BACKUP_KEY = "interview_session_last_backup_at"
+    BACKUP_INTERVAL_SECONDS = 1.0
     VERSION = "1.0.0"
     
     @staticmethod
     def get_session_hash() -> str:
         """Generate unique session identifier"""
-        session_data = {
-            "timestamp": datetime.now().isoformat(),
-            "user_agent": str(st.session_state.get("__user_agent", "unknown")),
-        }
-        return hashlib.md5(json.dumps(session_data, sort_keys=True).encode()).hexdigest()[:12]
+        return secrets.token_hex(6)
     
     @classmethod
     def initialize_session(cls) -> str:
         """Initialize or recover session state"""
-        session_id = cls.get_session_hash()
-        
-        # Try to restore from backup first
-        restored = cls.restore_session()
-        if restored:
-            logger.info(f"Session restored: {session_id}")
-            st.session_state[cls.SESSION_KEY] = restored
+        # Streamlit calls this on every rerun: a valid live session is kept,
+        # the backup is only used when the live state is missing or broken,
+        # and a new identifier is only generated for a fresh session
+        current = st.session_state.get(cls.SESSION_KEY)
+        if isinstance(current, dict) and "session_id" in current:
+            session_id = current["session_id"]
         else:
-            # Initialize fresh session
-            st.session_state[cls.SESSION_KEY] = {
-                "session_id": session_id,
-                "created_at": datetime.now().isoformat(),
-                "version": cls.VERSION,
-                "state": "initialized",
-                "pages_visited": [],
-                "interview_data": {},
-                "user_actions": []
-            }
-            logger.info(f"New session created: {session_id}")
+            restored = cls.restore_session()
+            if restored:
+                session_id = restored["session_id"]
+                logger.info("Session restored: %s", session_id)
+                st.session_state[cls.SESSION_KEY] = restored
+            else:
+                # Initialize fresh session
+                session_id = cls.get_session_hash()
+                st.session_state[cls.SESSION_KEY] = {
+                    "session_id": session_id,
+                    "created_at": datetime.now().isoformat(),
+                    "version": cls.VERSION,
+                    "state": "initialized",
+                    "last_page": None,
+                    "page_visit_count": 0,
+                    "interview_data": {},
+                    "user_actions": []
+                }
+                logger.info("New session created: %s", session_id)
         
         # Track page visit
         cls._track_page_visit()
         return session_id
     
     @classmethod
-    def save_session(cls):
-        """Save current session state to backup"""
+    def save_session(cls, force: bool = False):
+        """Save current session state to backup, at most once per interval unless forced"""
         if cls.SESSION_KEY in st.session_state:
+            # Bursts of update_state calls share one snapshot; the rest are
+            # picked up by the next save after the interval
+            now = time.monotonic()
+            last_backup_at = st.session_state.get(cls.LAST_BACKUP_KEY)
+            if not force and last_backup_at is not None and now - last_backup_at < cls.BACKUP_INTERVAL_SECONDS:
+                return
             try:
-                session_data = st.session_state[cls.SESSION_KEY].copy()
+                session_data = cls._snapshot(st.session_state[cls.SESSION_KEY])
                 session_data["last_saved"] = datetime.now().isoformat()
                 st.session_state[cls.BACKUP_KEY] = session_data
-                logger.debug(f"Session saved: {session_data.get('session_id', 'unknown')}")
+                st.session_state[cls.LAST_BACKUP_KEY] = now
+                logger.debug("Session saved: %s", session_data.get('session_id', 'unknown'))
             except Exception as e:
-                logger.error(f"Failed to save session: {str(e)}")
+                logger.error("Failed to save session: %s", e)
+    
+    @staticmethod
+    def _snapshot(session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the session dict and its direct dict/list values, one level deep"""
+        return {
+            key: value.copy() if isinstance(value, (dict, list)) else value
+            for key, value in session_data.items()
+        }
     
     @classmethod
     def restore_session(cls) -> Optional[Dict[str, Any]]:
@@ -74,25 +94,27 @@ class SessionManager:
                 backup_data = st.session_state[cls.BACKUP_KEY]
                 # Validate backup data
                 if isinstance(backup_data, dict) and "session_id" in backup_data:
-                    logger.info(f"Restoring session: {backup_data['session_id']}")
-                    return backup_data
+                    logger.info("Restoring session: %s", backup_data['session_id'])
+                    # The restored state becomes live; keep the backup intact
+                    return cls._snapshot(backup_data)
             return None
         except Exception as e:
-            logger.error(f"Failed to restore session: {str(e)}")
+            logger.error("Failed to restore session: %s", e)
             return None
     
     @classmethod
     def clear_session(cls):
         """Safely clear session data"""
         session_id = st.session_state.get(cls.SESSION_KEY, {}).get("session_id", "unknown")
-        logger.info(f"Clearing session: {session_id}")
+        logger.info("Clearing session: %s", session_id)
         
         # Log session completion before clearing
         if st.session_state.get(cls.SESSION_KEY, {}).get("state") == "completed":
             cls._log_session_completion()
         
-        # Clear session data
-        keys_to_clear = [cls.SESSION_KEY, cls.BACKUP_KEY, "orchestrator_agent", "session_id"]
+        # Clear session data; dropping the backup time means the next
+        # session's first save always takes a snapshot
+        keys_to_clear = [cls.SESSION_KEY, cls.BACKUP_KEY, cls.LAST_BACKUP_KEY, "orchestrator_agent", "session_id"]
         for key in keys_to_clear:
             if key in st.session_state:
                 del st.session_state[key]
@@ -111,7 +133,7 @@ class SessionManager:
             session_data["last_updated"] = datetime.now().isoformat()
             st.session_state[cls.SESSION_KEY] = session_data
             cls.save_session()  # Auto-save on update
-            logger.debug(f"Session updated: {session_data.get('session_id', 'unknown')}")
+            logger.debug("Session updated: %s", session_data.get('session_id', 'unknown'))
     
     @classmethod
     def _track_page_visit(cls):
@@ -119,13 +141,12 @@ class SessionManager:
         current_page = st.session_state.get("page", "unknown")
         if cls.SESSION_KEY in st.session_state:
             session_data = st.session_state[cls.SESSION_KEY]
-            if "pages_visited" not in session_data:
-                session_data["pages_visited"] = []
             
-            # Avoid duplicate consecutive visits
-            if not session_data["pages_visited"] or session_data["pages_visited"][-1] != current_page:
-                session_data["pages_visited"].append(current_page)
-                st.session_state[cls.SESSION_KEY] = session_data
+            # Avoid duplicate consecutive visits; only the last page and a
+            # count are kept so the session does not grow on every rerun
+            if session_data.get("last_page") != current_page:
+                session_data["last_page"] = current_page
+                session_data["page_visit_count"] = session_data.get("page_visit_count", 0) + 1
     
     @classmethod
     def _log_session_completion(cls):
@@ -136,7 +157,7 @@ class SessionManager:
             "duration": cls._calculate_duration(session_data),
             "questions_asked": len(session_data.get("interview_data", {}).get("questions", [])),
             "final_score": session_data.get("interview_data", {}).get("final_score"),
-            "pages_visited": len(session_data.get("pages_visited", []))
+            "page_visit_count": session_data.get("page_visit_count", 0)
         })
     
     @staticmethod
@@ -10,17 +10,23 @@ logger = get_logger(__name__)
 
 # Speech recognition config
 SPEECH_RECOGNITION_TIMEOUT = int(os.getenv("SPEECH_RECOGNITION_TIMEOUT", "30"))
-SUPPORTED_LANGUAGES = ["en-US", "en-GB", "es-ES", "fr-FR", "de-DE", "ja-JP"]
+SUPPORTED_LANGUAGES = ("en-US", "en-GB", "es-ES", "fr-FR", "de-DE", "ja-JP")
+# Membership checks hash instead of scanning; the tuple keeps the listing order
+_SUPPORTED_LANGUAGE_SET = frozenset(SUPPORTED_LANGUAGES)
 MIN_AUDIO_DURATION = 1  # seconds
 MAX_AUDIO_DURATION = 120  # seconds
 
+# Byte bounds for validate_audio (rough estimate: 16kHz * 2 bytes per second)
+_MIN_AUDIO_SIZE = MIN_AUDIO_DURATION * 32000
+_MAX_AUDIO_SIZE = MAX_AUDIO_DURATION * 32000
+
 
 class SpeechRecognizer:
     """Speech recognition interface for future integration"""
     
     def __init__(self):
         self.timeout = SPEECH_RECOGNITION_TIMEOUT
-        self.supported_languages = SUPPORTED_LANGUAGES
+        self.supported_languages = _SUPPORTED_LANGUAGE_SET
 
     async def recognize_speech(self, audio_data: bytes, language: str = "en-US") -> Optional[str]:
         """
@@ -59,7 +65,7 @@ class SpeechRecognizer:
             logger.error(f"Speech recognition error: {str(e)}")
             raise SpeechRecognitionError(f"Speech recognition failed: {str(e)}")
 
-    async def validate_audio(self, audio_data: bytes) -> bool:
+    def validate_audio(self, audio_data: bytes) -> bool:
         """
         Validate audio data before processing
         
@@ -69,30 +75,17 @@ class SpeechRecognizer:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            if not audio_data:
-                return False
-            
-            # Check minimum size (rough estimate: ~16KB for 1 second at 16kHz)
-            min_size = MIN_AUDIO_DURATION * 32000  # 16kHz * 2 bytes
-            max_size = MAX_AUDIO_DURATION * 32000
-            
-            if len(audio_data) < min_size:
-                logger.warning(f"Audio too short: {len(audio_data)} bytes")
-                return False
-            
-            if len(audio_data) > max_size:
-                logger.warning(f"Audio too long: {len(audio_data)} bytes")
-                return False
-            
+        # A length check only; no I/O, so it runs synchronously
+        size = len(audio_data) if audio_data else 0
+        if _MIN_AUDIO_SIZE <= size <= _MAX_AUDIO_SIZE:
             return True
-        except Exception as e:
-            logger.error(f"Audio validation error: {str(e)}")
-            return False
+        
+        logger.warning("Audio size out of range: %d bytes", size)
+        return False
 
     async def get_supported_languages(self) -> list:
         """Get list of supported languages"""
-        return self.supported_languages
+        return list(SUPPORTED_LANGUAGES)
 
 
 # Singleton instance
@@ -3,51 +3,119 @@ Enhanced Structured Logging - Enterprise-grade logging with correlation IDs and
 Provides comprehensive observability for interview assessment system.
 """
 import logging
-import logging.handlers
 import os
 import json
+import threading
 import time
 import uuid
 from typing import Dict, Any, Optional
 from pathlib import Path
-from datetime import datetime
 from contextvars import ContextVar
 from functools import wraps
 
+from app.utils.logging_config import BatchedRotatingFileHandler, start_queue_logging, stop_logging
+
+try:
+    import orjson
+except ImportError:  # Optional fast encoder; fall back to the stdlib
+    orjson = None
+
 
 # Context variables for correlation tracking
 correlation_id: ContextVar[str] = ContextVar('correlation_id', default='')
 session_id: ContextVar[str] = ContextVar('session_id', default='')
 user_id: ContextVar[str] = ContextVar('user_id', default='')
 
+# Level names accepted by log_with_context, resolved without string work
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Log level by skill gap severity and by health status; anything else is ERROR
+_SEVERITY_LEVELS = {"Low": "INFO", "Medium": "WARNING"}
+_HEALTH_LEVELS = {"healthy": "INFO", "degraded": "WARNING"}
+
+
+def _dumps_log_entry(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to a JSON string, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(log_entry, default=str).decode()
+    return json.dumps(log_entry, default=str, ensure_ascii=False)
+
 
 class CorrelationFilter(logging.Filter):
     """Add correlation context to log records."""
     
+    # Bound once; formatters read these fields with a '' default, so unset
+    # context (scripts, the CLI) leaves the record untouched
+    _get_correlation_id = staticmethod(correlation_id.get)
+    _get_session_id = staticmethod(session_id.get)
+    _get_user_id = staticmethod(user_id.get)
+    
     def filter(self, record):
-        record.correlation_id = correlation_id.get()
-        record.session_id = session_id.get()
-        record.user_id = user_id.get()
+        value = self._get_correlation_id()
+        if value:
+            record.correlation_id = value
+        value = self._get_session_id()
+        if value:
+            record.session_id = value
+        value = self._get_user_id()
+        if value:
+            record.user_id = value
         return True
 
 
 class JSONFormatter(logging.Formatter):
     """Format log records as JSON for better parsing and analysis."""
     
+    # (epoch second, formatted local time) of the last record; bursts of
+    # records within the same second reuse it and only add microseconds
+    _second_cache = (None, "")
+    
+    # One log entry dict per thread, refilled in place for every record
+    _local = threading.local()
+    _OPTIONAL_KEYS = ("exception", "metrics", "operation", "duration_ms", "error_report")
+    
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record time as a local ISO timestamp with microseconds."""
+        second = int(created)
+        cached = self._second_cache
+        if cached[0] != second:
+            cached = self._second_cache = (
+                second, time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+            )
+        return f"{cached[1]}.{int((created - second) * 1e6):06d}"
+    
+    def _log_entry(self) -> Dict[str, Any]:
+        """Get this thread's reusable entry with last record's extras removed."""
+        log_entry = getattr(self._local, 'log_entry', None)
+        if log_entry is None:
+            log_entry = self._local.log_entry = {}
+        else:
+            for key in self._OPTIONAL_KEYS:
+                log_entry.pop(key, None)
+        return log_entry
+    
     def format(self, record):
-        log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "correlation_id": getattr(record, 'correlation_id', ''),
-            "session_id": getattr(record, 'session_id', ''),
-            "user_id": getattr(record, 'user_id', ''),
-        }
+        # Base keys keep their insertion order across reuses
+        log_entry = self._log_entry()
+        log_entry["timestamp"] = self._format_timestamp(record.created)
+        log_entry["level"] = record.levelname
+        log_entry["logger"] = record.name
+        log_entry["message"] = record.getMessage()
+        log_entry["correlation_id"] = getattr(record, 'correlation_id', '')
+        log_entry["session_id"] = getattr(record, 'session_id', '')
+        log_entry["user_id"] = getattr(record, 'user_id', '')
         
         # Add exception info if present
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exception"] = record.exc_text
         
         # Add extra fields
         if hasattr(record, 'metrics'):
@@ -56,8 +124,10 @@ class JSONFormatter(logging.Formatter):
             log_entry["operation"] = record.operation
         if hasattr(record, 'duration'):
             log_entry["duration_ms"] = record.duration
+        if hasattr(record, 'error_report'):
+            log_entry["error_report"] = record.error_report
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _dumps_log_entry(log_entry)
 
 
 class DetailedFormatter(logging.Formatter):
@@ -87,6 +157,14 @@ class DetailedFormatter(logging.Formatter):
         if hasattr(record, 'duration'):
             message += f" | Duration: {record.duration:.2f}ms"
         
+        # Add the error report's classification if present
+        error_report = getattr(record, 'error_report', None)
+        if error_report:
+            message += (
+                f" | Error: id={error_report['error_id']} category={error_report['category']}"
+                f" severity={error_report['severity']}"
+            )
+        
         return f"{context_str}{message}"
 
 
@@ -108,11 +186,12 @@ def setup_logging():
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, LOG_LEVEL))
     
-    # Clear existing handlers
+    # Clear existing handlers, stopping any listener from a previous setup
+    stop_logging()
     root_logger.handlers.clear()
     
     # File handler
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BatchedRotatingFileHandler(
         LOG_FILE,
         maxBytes=LOG_MAX_SIZE,
         backupCount=LOG_BACKUP_COUNT
@@ -123,11 +202,6 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, LOG_LEVEL))
     
-    # Add correlation filter to both handlers
-    correlation_filter = CorrelationFilter()
-    file_handler.addFilter(correlation_filter)
-    console_handler.addFilter(correlation_filter)
-    
     # Set formatters based on configuration
     if LOG_FORMAT == "json":
         formatter = JSONFormatter()
@@ -148,9 +222,11 @@ def setup_logging():
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
     
-    # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Callers only enqueue records; formatting and I/O happen on the
+    # listener thread so request paths never block on the log file.
+    # Correlation context lives in contextvars, so it must be captured on
+    # the calling thread before the record is handed off
+    start_queue_logging(file_handler, console_handler, filters=(CorrelationFilter(),))
     
     # Log startup
     logger = logging.getLogger(__name__)
@@ -190,29 +266,38 @@ def set_correlation_context(
 
 def generate_correlation_id() -> str:
     """Generate a new correlation ID."""
-    return str(uuid.uuid4())
+    # Undashed hex: same randomness, shorter in every log record it tags
+    return uuid.uuid4().hex
 
 
 def log_with_context(
     logger: logging.Logger,
     level: str,
     message: str,
+    *args,
     metrics: Optional[Dict[str, Any]] = None,
     operation: Optional[str] = None,
     **kwargs
 ):
-    """Log message with context and metrics."""
-    extra = {}
+    """Log message with context and metrics; args are %-formatted lazily."""
+    level_no = _LEVELS.get(level)
+    if level_no is None:
+        # Lower/mixed-case names are rare; unknown ones log at INFO as before
+        level_no = _LEVELS.get(level.upper(), logging.INFO)
     
+    # Filtered-out records never build their extra dict or message
+    if not logger.isEnabledFor(level_no):
+        return
+    
+    # kwargs is already a fresh dict, so it doubles as extra; calls with no
+    # context at all pass extra=None instead of an empty dict
+    extra = kwargs
     if metrics:
         extra["metrics"] = metrics
     if operation:
         extra["operation"] = operation
     
-    extra.update(kwargs)
-    
-    log_method = getattr(logger, level.lower(), logger.info)
-    log_method(message, extra=extra)
+    logger.log(level_no, message, *args, extra=extra or None)
 
 
 def log_interview_start(
@@ -233,7 +318,8 @@ def log_interview_start(
     log_with_context(
         logger,
         "INFO",
-        f"Interview session started for {candidate_name}",
+        "Interview session started for %s",
+        candidate_name,
         operation="interview_start",
         metrics={
             "candidate_name": candidate_name,
@@ -257,7 +343,7 @@ def log_interview_end(
     log_with_context(
         logger,
         "INFO",
-        f"Interview session completed",
+        "Interview session completed",
         operation="interview_end",
         metrics={
             "session_id": session_id,
@@ -282,7 +368,8 @@ def log_question_generated(
     log_with_context(
         logger,
         "INFO",
-        f"Question generated: {question_id}",
+        "Question generated: %s",
+        question_id,
         operation="question_generation",
         metrics={
             "session_id": session_id,
@@ -303,11 +390,15 @@ def log_answer_evaluated(
 ):
     """Log answer evaluation event."""
     logger = get_logger("interview.evaluation")
+    # Metrics are rounded only for records that will actually be emitted
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     log_with_context(
         logger,
         "INFO",
-        f"Answer evaluated for question: {question_id}",
+        "Answer evaluated for question: %s",
+        question_id,
         operation="answer_evaluation",
         metrics={
             "session_id": session_id,
@@ -327,11 +418,13 @@ def log_topic_coverage(
 ):
     """Log topic coverage metrics."""
     logger = get_logger("interview.coverage")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     log_with_context(
         logger,
         "INFO",
-        f"Topic coverage updated",
+        "Topic coverage updated",
         operation="topic_coverage",
         metrics={
             "session_id": session_id,
@@ -356,7 +449,9 @@ def log_difficulty_adjustment(
     log_with_context(
         logger,
         "INFO",
-        f"Difficulty adjusted: {old_difficulty} → {new_difficulty}",
+        "Difficulty adjusted: %s → %s",
+        old_difficulty,
+        new_difficulty,
         operation="difficulty_adjustment",
         metrics={
             "session_id": session_id,
@@ -377,11 +472,15 @@ def log_skill_gap_identified(
 ):
     """Log identified skill gap."""
     logger = get_logger("interview.analysis")
+    level = _SEVERITY_LEVELS.get(severity, "ERROR")
+    if not logger.isEnabledFor(_LEVELS[level]):
+        return
     
     log_with_context(
         logger,
-        "INFO" if severity == "Low" else "WARNING" if severity == "Medium" else "ERROR",
-        f"Skill gap identified in {category}",
+        level,
+        "Skill gap identified in %s",
+        category,
         operation="skill_gap_analysis",
         metrics={
             "session_id": session_id,
@@ -396,10 +495,12 @@ def log_skill_gap_identified(
 def log_question_selected(session_id: str, question_topic: str, difficulty: str):
     """Log question selection."""
     agent_logger = get_logger("agents")
+    if not agent_logger.isEnabledFor(logging.DEBUG):
+        return
     log_with_context(
         agent_logger,
         "DEBUG",
-        f"Question selected",
+        "Question selected",
         operation="question_selection",
         metrics={
             "session_id": session_id,
@@ -415,10 +516,12 @@ def log_question_selected(session_id: str, question_topic: str, difficulty: str)
 def log_llm_call(prompt_length: int, response_length: int, duration_ms: float):
     """Log LLM API call."""
     llm_logger = get_logger("llm")
+    if not llm_logger.isEnabledFor(logging.DEBUG):
+        return
     log_with_context(
         llm_logger,
         "DEBUG",
-        f"LLM call completed",
+        "LLM call completed",
         operation="llm_call",
         metrics={
             "prompt_length": prompt_length,
@@ -431,7 +534,7 @@ def log_llm_call(prompt_length: int, response_length: int, duration_ms: float):
 def log_error(error: Exception, context: str = ""):
     """Log an error with context."""
     logger = get_logger(__name__)
-    logger.error(f"Error in {context}: {str(error)}", exc_info=True)
+    logger.error("Error in %s: %s", context, error, exc_info=True)
 
 
 def log_system_health(
@@ -445,8 +548,9 @@ def log_system_health(
     
     log_with_context(
         logger,
-        "INFO" if status == "healthy" else "WARNING" if status == "degraded" else "ERROR",
-        f"System health status: {status}",
+        _HEALTH_LEVELS.get(status, "ERROR"),
+        "System health status: %s",
+        status,
         operation="system_health_check",
         metrics={
             "status": status,
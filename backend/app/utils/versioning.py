@@ -2,7 +2,7 @@
 Application Versioning and Release Management
 """
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 class AppVersion:
     """Application version management"""
@@ -12,27 +12,33 @@ class AppVersion:
     MINOR = 0
     PATCH = 0
     BUILD = datetime.now().strftime("%Y%m%d")
+    BUILD_DATE = datetime.now().isoformat()
+    
+    # Fixed for the life of the process, so formatted once at import
+    VERSION_STRING = f"v{MAJOR}.{MINOR}.{PATCH}+{BUILD}"
+    SHORT_VERSION = f"v{MAJOR}.{MINOR}.{PATCH}"
+    BUILD_INFO = {
+        "version": VERSION_STRING,
+        "short_version": SHORT_VERSION,
+        "build_date": BUILD_DATE,
+        "environment": "production",
+        "platform": "web"
+    }
     
     @classmethod
     def get_version_string(cls) -> str:
         """Get full version string"""
-        return f"v{cls.MAJOR}.{cls.MINOR}.{cls.PATCH}+{cls.BUILD}"
+        return cls.VERSION_STRING
     
     @classmethod
     def get_short_version(cls) -> str:
         """Get short version (without build)"""
-        return f"v{cls.MAJOR}.{cls.MINOR}.{cls.PATCH}"
+        return cls.SHORT_VERSION
     
     @classmethod
     def get_build_info(cls) -> Dict[str, str]:
         """Get detailed build information"""
-        return {
-            "version": cls.get_version_string(),
-            "short_version": cls.get_short_version(),
-            "build_date": datetime.now().isoformat(),
-            "environment": "production",
-            "platform": "web"
-        }
+        return cls.BUILD_INFO.copy()
 
 class Changelog:
     """Application changelog management"""
@@ -81,22 +87,28 @@ class Changelog:
         """Get latest changelog entries"""
         return cls.ENTRIES[:limit]
     
+    # ENTRIES never changes at runtime, so the markdown is rendered once
+    _changelog_markdown: Optional[str] = None
+    
     @classmethod
     def get_changelog_markdown(cls) -> str:
         """Get formatted changelog as markdown"""
-        markdown = "# Changelog\n\n"
+        if cls._changelog_markdown is not None:
+            return cls._changelog_markdown
+        
+        parts = ["# Changelog\n\n"]
         
         for entry in cls.ENTRIES:
-            markdown += f"## {entry['version']} - {entry['date']}\n"
+            parts.append(f"## {entry['version']} - {entry['date']}\n")
             
             if entry['type'] == 'release':
-                markdown += "**Initial Release**\n\n"
+                parts.append("**Initial Release**\n\n")
             
-            for change in entry['changes']:
-                markdown += f"- {change}\n"
-            markdown += "\n"
+            parts.extend(f"- {change}\n" for change in entry['changes'])
+            parts.append("\n")
         
-        return markdown
+        cls._changelog_markdown = "".join(parts)
+        return cls._changelog_markdown
 
 class AppBranding:
     """Application branding and ownership information"""
@@ -106,22 +118,26 @@ class AppBranding:
     OWNER = "Interview Agent Team"
     COPYRIGHT_YEAR = datetime.now().year
     
+    # Built once at import, like the version strings
+    BRANDING_INFO = {
+        "name": NAME,
+        "tagline": TAGLINE,
+        "owner": OWNER,
+        "version": AppVersion.VERSION_STRING,
+        "copyright": f"© {COPYRIGHT_YEAR} {OWNER}",
+        "description": "An AI-powered interview preparation platform designed to help you master technical interviews through realistic practice sessions and detailed feedback."
+    }
+    FOOTER_TEXT = f"{NAME} {AppVersion.SHORT_VERSION} | {COPYRIGHT_YEAR} {OWNER}"
+    
     @classmethod
     def get_branding_info(cls) -> Dict[str, str]:
         """Get complete branding information"""
-        return {
-            "name": cls.NAME,
-            "tagline": cls.TAGLINE,
-            "owner": cls.OWNER,
-            "version": AppVersion.get_version_string(),
-            "copyright": f"© {cls.COPYRIGHT_YEAR} {cls.OWNER}",
-            "description": "An AI-powered interview preparation platform designed to help you master technical interviews through realistic practice sessions and detailed feedback."
-        }
+        return cls.BRANDING_INFO.copy()
     
     @classmethod
     def get_footer_text(cls) -> str:
         """Get footer text with version and copyright"""
-        return f"{cls.NAME} {AppVersion.get_short_version()} | {cls.COPYRIGHT_YEAR} {cls.OWNER}"
+        return cls.FOOTER_TEXT
 
 # Convenience functions
 def get_app_version() -> str:
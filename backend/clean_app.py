@@ -1,10 +1,11 @@
+import json
 import sys
 from pathlib import Path
 
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.utils.database import init_db
 from app.utils.logging_config import setup_logging
@@ -25,7 +26,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
+    # Explicit methods; requests without an Origin header (such as /health
+    # probes) already pass straight through the middleware
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
 )
 
@@ -33,6 +36,12 @@ app.include_router(auth_routes.router)
 app.include_router(interview_routes.router)
 app.include_router(intelligence_routes.router)
 
+# Constant payload, serialized once; probes skip encoding on every request
+_HEALTH_RESPONSE = Response(
+    content=json.dumps({"status": "healthy", "service": "InterviewPilot"}).encode(),
+    media_type="application/json",
+)
+
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "service": "InterviewPilot"}
+    return _HEALTH_RESPONSE
@@ -17,9 +17,11 @@ Base.metadata.create_all(bind=engine)
 db = SessionLocal()
 
 try:
-    # Check if test user exists
-    test_user = db.query(User).filter(User.email == "test@example.com").first()
-    if not test_user:
+    # One query for the listing; it also tells us whether the test user
+    # exists, so bcrypt only runs when the user actually has to be created
+    users = db.query(User.email, User.id).order_by(User.id).all()
+    test_user_id = next((user.id for user in users if user.email == "test@example.com"), None)
+    if test_user_id is None:
         print("Creating test user...")
         test_user = User(
             email="test@example.com",
@@ -28,17 +30,18 @@ try:
             is_active=True
         )
         db.add(test_user)
+        db.flush()
+        test_user_id = test_user.id
         db.commit()
-        db.refresh(test_user)
-        print(f"✓ Test user created (ID: {test_user.id})")
+        users.append(("test@example.com", test_user_id))
+        print(f"✓ Test user created (ID: {test_user_id})")
     else:
-        print(f"✓ Test user already exists (ID: {test_user.id})")
+        print(f"✓ Test user already exists (ID: {test_user_id})")
     
     # List all users
-    users = db.query(User).all()
-    print(f"\nTotal users: {len(users)}")
-    for user in users:
-        print(f"  - {user.email} (ID: {user.id})")
+    lines = [f"\nTotal users: {len(users)}"]
+    lines.extend(f"  - {email} (ID: {user_id})" for email, user_id in users)
+    print("\n".join(lines))
         
 finally:
     db.close()
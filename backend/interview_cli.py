@@ -14,38 +14,94 @@ Requirements:
 import os
 import sys
 import asyncio
+import threading
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+_BASE_PATH = Path(__file__).parent
+_REQUIRED_DIRS = tuple(_BASE_PATH / name for name in ("logs", "temp"))
+
 # Ensure the app directory is in path
-sys.path.insert(0, str(Path(__file__).parent))
-
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
-
-# Import rich for CLI formatting
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.prompt import Prompt, IntPrompt
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.markdown import Markdown
-    from rich import print as rprint
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    print("Note: Install 'rich' for better CLI experience: pip install rich")
-
-# Import interview components
-from app.agents.question_selector_agent import QuestionSelectorAgent
-from app.agents.evaluation_agent import EvaluationAgent
-from app.evaluation.scorer import Scorer
-from app.evaluation.report_generator import ReportGenerator
-from app.memory.memory_manager import MemoryManager, InterviewState
-from app.schemas.question_schema import InterviewQuestion
-from app.data.question_repository import get_question_repository
+sys.path.insert(0, str(_BASE_PATH))
+
+# Rich, the agents and dotenv are imported by _load_dependencies() when an
+# interview actually starts, so importing this module stays cheap
+RICH_AVAILABLE = False
+
+# Erase display, then move the cursor home
+_CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
+
+_BANNER_TEXT = """
+    ╔═══════════════════════════════════════════════════════════╗
+    ║                                                           ║
+    ║           🎯  AI INTERVIEW AGENT  🎯                      ║
+    ║                                                           ║
+    ║     Adaptive Technical Interview Simulator                ║
+    ║                                                           ║
+    ╚═══════════════════════════════════════════════════════════╝
+    """
+
+# Experience levels and their menu, joined once and printed in one call
+_EXPERIENCE_LEVELS = ("fresher", "mid", "senior")
+_EXPERIENCE_DESCRIPTIONS = {
+    "fresher": "0-2 years (Entry level / New graduate)",
+    "mid": "2-5 years (Intermediate)",
+    "senior": "5+ years (Experienced / Lead)",
+}
+_EXPERIENCE_MENU = "\n".join(
+    f"  {i}. {level.title()} - {_EXPERIENCE_DESCRIPTIONS[level]}"
+    for i, level in enumerate(_EXPERIENCE_LEVELS, 1)
+)
+
+# Constant panels, built once rich is loaded and reused on every render
+_BANNER_PANEL = None
+_COMPLETE_PANEL = None
+_SCORE_STYLES = ()
+
+
+def _load_dependencies():
+    """Load environment variables, rich and the interview components."""
+    global RICH_AVAILABLE, Console, Group, Panel, Prompt, IntPrompt, Table
+    global Progress, SpinnerColumn, TextColumn, Markdown, rprint
+    global QuestionSelectorAgent, EvaluationAgent, Scorer, ReportGenerator
+    global MemoryManager, InterviewState, InterviewQuestion, get_question_repository
+    global _BANNER_PANEL, _COMPLETE_PANEL, _SCORE_STYLES, Text
+    
+    # Load environment variables before the agents read their configuration
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # Import rich for CLI formatting
+    try:
+        from rich.console import Console, Group
+        from rich.panel import Panel
+        from rich.prompt import Prompt, IntPrompt
+        from rich.table import Table
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from rich.markdown import Markdown
+        from rich.style import Style
+        from rich.text import Text
+        from rich import print as rprint
+        RICH_AVAILABLE = True
+        _BANNER_PANEL = Panel(_BANNER_TEXT, style="bold blue")
+        _COMPLETE_PANEL = Panel("INTERVIEW COMPLETE", style="bold green")
+        # Indexed by the whole-number score: below 5 red, below 7 yellow
+        red, yellow, green = (Style.parse(f"bold {color}") for color in ("red", "yellow", "green"))
+        _SCORE_STYLES = (red,) * 5 + (yellow,) * 2 + (green,) * 4
+    except ImportError:
+        RICH_AVAILABLE = False
+        print("Note: Install 'rich' for better CLI experience: pip install rich")
+    
+    # Import interview components
+    from app.agents.question_selector_agent import QuestionSelectorAgent
+    from app.agents.evaluation_agent import EvaluationAgent
+    from app.evaluation.scorer import Scorer
+    from app.evaluation.report_generator import ReportGenerator
+    from app.memory.memory_manager import MemoryManager, InterviewState
+    from app.schemas.question_schema import InterviewQuestion
+    from app.data.question_repository import get_question_repository
 
 
 # ============================================================================
@@ -59,26 +115,59 @@ def get_console() -> Optional['Console']:
     return None
 
 
-def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+def clear_screen(console: Optional['Console'] = None):
+    """Clear the terminal screen without spawning a shell where possible."""
+    if console:
+        console.clear()
+    elif os.name == 'nt':
+        # Legacy Windows consoles may not interpret ANSI escapes
+        os.system('cls')
+    else:
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
+
+
+async def read_input(func=input):
+    """
+    Run a blocking stdin read without stalling the event loop.
+    
+    The read happens on a daemon thread whose result is abandoned if the
+    awaiting task is cancelled (e.g. by Ctrl-C), so neither event loop
+    shutdown nor interpreter exit waits for a thread stuck in input().
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def reader():
+        result = error = None
+        try:
+            result = func()
+        except BaseException as exc:
+            error = exc
+        try:
+            loop.call_soon_threadsafe(deliver, result, error)
+        except RuntimeError:
+            # The loop has already closed; nobody is waiting any more
+            pass
+    
+    threading.Thread(target=reader, name="cli-input", daemon=True).start()
+    return await future
 
 
 def print_banner(console: Optional['Console'] = None):
     """Display the welcome banner."""
-    banner = """
-    ╔═══════════════════════════════════════════════════════════╗
-    ║                                                           ║
-    ║           🎯  AI INTERVIEW AGENT  🎯                      ║
-    ║                                                           ║
-    ║     Adaptive Technical Interview Simulator                ║
-    ║                                                           ║
-    ╚═══════════════════════════════════════════════════════════╝
-    """
     if console:
-        console.print(Panel(banner, style="bold blue"))
+        console.print(_BANNER_PANEL)
     else:
-        print(banner)
+        print(_BANNER_TEXT)
 
 
 def print_question(question: Dict[str, Any], question_num: int, total: int, console: Optional['Console'] = None):
@@ -113,29 +202,22 @@ def print_feedback(evaluation: Dict[str, Any], console: Optional['Console'] = No
     strengths = evaluation.get("strengths", [])
     weaknesses = evaluation.get("weaknesses", [])
     
-    # Color based on score
-    if score >= 7:
-        score_style = "bold green"
-    elif score >= 5:
-        score_style = "bold yellow"
-    else:
-        score_style = "bold red"
-    
     if console:
-        console.print()
-        console.print(f"Score: [{score_style}]{score:.1f}/10[/]")
-        console.print()
-        console.print(f"[italic]{feedback}[/italic]")
+        # Color based on score, from pre-parsed styles
+        score_style = _SCORE_STYLES[int(min(max(score, 0), 10))]
+        
+        # Collected into one Group so the feedback renders in a single print
+        parts = ["", Text.assemble("Score: ", (f"{score:.1f}/10", score_style)), "", f"[italic]{feedback}[/italic]"]
         
         if strengths:
-            console.print("\n[green]Strengths:[/green]")
-            for s in strengths[:3]:
-                console.print(f"  + {s}")
+            parts.append("\n[green]Strengths:[/green]")
+            parts.extend(f"  + {s}" for s in strengths[:3])
         
         if weaknesses:
-            console.print("\n[yellow]Areas to improve:[/yellow]")
-            for w in weaknesses[:3]:
-                console.print(f"  - {w}")
+            parts.append("\n[yellow]Areas to improve:[/yellow]")
+            parts.extend(f"  - {w}" for w in weaknesses[:3])
+        
+        console.print(Group(*parts))
     else:
         print(f"\nScore: {score:.1f}/10")
         print(f"\n{feedback}")
@@ -152,10 +234,6 @@ def print_feedback(evaluation: Dict[str, Any], console: Optional['Console'] = No
 def print_report(report: Dict[str, Any], console: Optional['Console'] = None):
     """Display the final report."""
     if console:
-        console.print()
-        console.print(Panel("INTERVIEW COMPLETE", style="bold green"))
-        console.print()
-        
         # Score table
         table = Table(title="Performance Summary", show_header=True)
         table.add_column("Metric", style="cyan")
@@ -167,38 +245,42 @@ def print_report(report: Dict[str, Any], console: Optional['Console'] = None):
         table.add_row("Strongest Area", report.get("strongest_area", "N/A"))
         table.add_row("Focus Area", report.get("weakest_area", "N/A"))
         
-        console.print(table)
-        console.print()
-        
-        # Assessment
-        console.print(Panel(
-            report.get("overall_assessment", "No assessment available."),
-            title="Assessment",
-            border_style="blue",
-        ))
+        # The whole report is collected into one Group and printed once
+        parts = [
+            "",
+            _COMPLETE_PANEL,
+            "",
+            table,
+            "",
+            # Assessment
+            Panel(
+                report.get("overall_assessment", "No assessment available."),
+                title="Assessment",
+                border_style="blue",
+            ),
+        ]
         
         # Strengths and improvements
-        console.print()
-        console.print("[bold green]Top Strengths:[/bold green]")
-        for s in report.get("top_strengths", [])[:5]:
-            console.print(f"  ✓ {s}")
+        parts += ["", "[bold green]Top Strengths:[/bold green]"]
+        parts.extend(f"  ✓ {s}" for s in report.get("top_strengths", [])[:5])
         
-        console.print()
-        console.print("[bold yellow]Priority Improvements:[/bold yellow]")
-        for i in report.get("priority_improvements", [])[:5]:
-            console.print(f"  → {i}")
+        parts += ["", "[bold yellow]Priority Improvements:[/bold yellow]"]
+        parts.extend(f"  → {i}" for i in report.get("priority_improvements", [])[:5])
         
         # Next steps
-        console.print()
-        console.print("[bold cyan]Recommended Next Steps:[/bold cyan]")
-        for idx, step in enumerate(report.get("next_steps", [])[:4], 1):
-            console.print(f"  {idx}. {step}")
+        parts += ["", "[bold cyan]Recommended Next Steps:[/bold cyan]"]
+        parts.extend(
+            f"  {idx}. {step}" for idx, step in enumerate(report.get("next_steps", [])[:4], 1)
+        )
         
-        console.print()
-        console.print(Panel(
-            report.get("encouragement", "Keep practicing!"),
-            style="bold blue",
-        ))
+        parts += [
+            "",
+            Panel(
+                report.get("encouragement", "Keep practicing!"),
+                style="bold blue",
+            ),
+        ]
+        console.print(Group(*parts))
     else:
         # Plain text fallback
         from app.evaluation.report_generator import ReportGenerator
@@ -206,6 +288,62 @@ def print_report(report: Dict[str, Any], console: Optional['Console'] = None):
         print(rg.generate_text_report(report))
 
 
+# ============================================================================
+# Output Sinks
+# ============================================================================
+
+class PlainUISink:
+    """Writes session messages as plain text; styles are ignored."""
+    
+    def line(self, text: str = "", style: Optional[str] = None):
+        """Print one message."""
+        print(text)
+    
+    def prompt_int(self, text: str, default: int) -> int:
+        """Ask for a number; raises ValueError on non-numeric input."""
+        return int(input(f"\n{text} (default: {default}): ") or default)
+    
+    @contextmanager
+    def status(self, description: str):
+        """Announce a step that is about to run."""
+        print(f"\n{description}")
+        yield
+
+
+class RichUISink(PlainUISink):
+    """Writes session messages through a Rich console."""
+    
+    def __init__(self, console: 'Console'):
+        self.console = console
+        # One spinner display, started only while waiting on the agents; it
+        # is stopped again before reading input so it never redraws over it
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        )
+    
+    def line(self, text: str = "", style: Optional[str] = None):
+        """Print one message, in ``style`` if given."""
+        self.console.print(text, style=style)
+    
+    def prompt_int(self, text: str, default: int) -> int:
+        """Ask for a number; Rich re-prompts on non-numeric input."""
+        return IntPrompt.ask(f"\n{text}", default=default, console=self.console)
+    
+    @contextmanager
+    def status(self, description: str):
+        """Show a spinner while the block runs."""
+        task = self._progress.add_task(description, total=None)
+        self._progress.start()
+        try:
+            yield
+        finally:
+            self._progress.stop()
+            self._progress.remove_task(task)
+
+
 # ============================================================================
 # Main Interview Class
 # ============================================================================
@@ -229,106 +367,78 @@ class InterviewSession:
         self.report_generator = ReportGenerator()
         self.memory_manager = MemoryManager()
         self.state: Optional[InterviewState] = None
+        self._next_question: Optional[asyncio.Task] = None
+        # All session messages go through one sink instead of branching
+        self.ui = RichUISink(console) if console else PlainUISink()
         
         # Configuration
         self.max_questions = int(os.getenv("INTERVIEW_MAX_QUESTIONS", "8"))
-        self.all_strengths: List[str] = []
-        self.all_weaknesses: List[str] = []
+        # Bounded to a few entries per question, however long the session runs
+        self.all_strengths: deque = deque(maxlen=self.max_questions * 5)
+        self.all_weaknesses: deque = deque(maxlen=self.max_questions * 5)
     
     def select_role(self) -> str:
         """Allow user to select their target role."""
         roles = self.question_selector.get_available_roles()
-        
-        if self.console:
-            self.console.print("\n[bold]Select your target role:[/bold]\n")
-            for i, role in enumerate(roles, 1):
-                self.console.print(f"  {i}. {role}")
-            self.console.print()
-            
-            while True:
-                try:
-                    choice = IntPrompt.ask("Enter number", default=1)
-                    if 1 <= choice <= len(roles):
-                        return roles[choice - 1]
-                    self.console.print("[red]Invalid choice. Try again.[/red]")
-                except Exception:
-                    self.console.print("[red]Please enter a valid number.[/red]")
-        else:
-            print("\nSelect your target role:\n")
-            for i, role in enumerate(roles, 1):
-                print(f"  {i}. {role}")
-            
-            while True:
-                try:
-                    choice = int(input("\nEnter number (default: 1): ") or "1")
-                    if 1 <= choice <= len(roles):
-                        return roles[choice - 1]
-                    print("Invalid choice. Try again.")
-                except ValueError:
-                    print("Please enter a valid number.")
+        menu = "\n".join(f"  {i}. {role}" for i, role in enumerate(roles, 1))
+        return self._select("Select your target role:", menu, roles, default=1)
     
     def select_experience_level(self) -> str:
         """Allow user to select their experience level."""
-        levels = ["fresher", "mid", "senior"]
-        descriptions = {
-            "fresher": "0-2 years (Entry level / New graduate)",
-            "mid": "2-5 years (Intermediate)",
-            "senior": "5+ years (Experienced / Lead)",
-        }
+        return self._select("Select your experience level:", _EXPERIENCE_MENU, _EXPERIENCE_LEVELS, default=2)
+    
+    def _select(self, title: str, menu: str, options, default: int) -> str:
+        """Show a numbered menu and return the chosen option."""
+        self.ui.line(f"\n{title}\n", style="bold")
+        self.ui.line(menu)
         
-        if self.console:
-            self.console.print("\n[bold]Select your experience level:[/bold]\n")
-            for i, level in enumerate(levels, 1):
-                self.console.print(f"  {i}. {level.title()} - {descriptions[level]}")
-            self.console.print()
-            
-            while True:
-                try:
-                    choice = IntPrompt.ask("Enter number", default=2)
-                    if 1 <= choice <= len(levels):
-                        return levels[choice - 1]
-                    self.console.print("[red]Invalid choice. Try again.[/red]")
-                except Exception:
-                    self.console.print("[red]Please enter a valid number.[/red]")
-        else:
-            print("\nSelect your experience level:\n")
-            for i, level in enumerate(levels, 1):
-                print(f"  {i}. {level.title()} - {descriptions[level]}")
-            
-            while True:
-                try:
-                    choice = int(input("\nEnter number (default: 2): ") or "2")
-                    if 1 <= choice <= len(levels):
-                        return levels[choice - 1]
-                    print("Invalid choice. Try again.")
-                except ValueError:
-                    print("Please enter a valid number.")
+        while True:
+            try:
+                choice = self.ui.prompt_int("Enter number", default)
+                if 1 <= choice <= len(options):
+                    return options[choice - 1]
+                self.ui.line("Invalid choice. Try again.", style="red")
+            except ValueError:
+                self.ui.line("Please enter a valid number.", style="red")
     
-    def get_user_answer(self) -> str:
+    async def get_user_answer(self) -> str:
         """Get the user's answer to a question."""
-        if self.console:
-            self.console.print("\n[dim]Type your answer (press Enter twice to submit, or type 'skip' to skip):[/dim]\n")
-        else:
-            print("\nType your answer (press Enter twice to submit, or type 'skip' to skip):\n")
+        self.ui.line("\nType your answer (press Enter twice to submit, or type 'skip' to skip):\n", style="dim")
         
+        # Blocking reads happen on a daemon thread so the event loop (and any
+        # task running on it) is not stalled while the user types
+        return await read_input(self._read_answer)
+    
+    def _read_answer(self) -> str:
+        """Read answer lines from stdin until two consecutive blank lines."""
         lines = []
         empty_count = 0
+        # Piped answers are read straight from the buffered stream, without
+        # input()'s prompt handling; end of input ends the answer either way
+        interactive = sys.stdin.isatty()
         
         while True:
-            try:
-                line = input()
-                if line.lower() == 'skip':
-                    return "I would like to skip this question."
-                if line == "":
-                    empty_count += 1
-                    if empty_count >= 2:
-                        break
-                    lines.append("")
-                else:
-                    empty_count = 0
-                    lines.append(line)
-            except EOFError:
-                break
+            if interactive:
+                try:
+                    line = input()
+                except EOFError:
+                    break
+            else:
+                line = sys.stdin.readline()
+                if not line:
+                    break
+                line = line.rstrip("\n")
+            
+            if line.lower() == 'skip':
+                return "I would like to skip this question."
+            if line == "":
+                empty_count += 1
+                if empty_count >= 2:
+                    break
+                lines.append("")
+            else:
+                empty_count = 0
+                lines.append(line)
         
         answer = "\n".join(lines).strip()
         return answer if answer else "I don't have an answer for this question."
@@ -337,26 +447,18 @@ class InterviewSession:
         """Run the complete interview session."""
         # Validate API key
         if not os.getenv("OPENAI_API_KEY"):
-            if self.console:
-                self.console.print("[bold red]Error: OPENAI_API_KEY not set![/bold red]")
-                self.console.print("\nPlease set your OpenAI API key:")
-                self.console.print("  1. Create a .env file in the backend directory")
-                self.console.print("  2. Add: OPENAI_API_KEY=your_key_here")
-            else:
-                print("Error: OPENAI_API_KEY not set!")
-                print("\nPlease set your OpenAI API key in .env file")
+            self.ui.line("Error: OPENAI_API_KEY not set!", style="bold red")
+            self.ui.line("\nPlease set your OpenAI API key:")
+            self.ui.line("  1. Create a .env file in the backend directory")
+            self.ui.line("  2. Add: OPENAI_API_KEY=your_key_here")
             return
         
         # Welcome and setup
-        clear_screen()
+        clear_screen(self.console)
         print_banner(self.console)
         
-        if self.console:
-            self.console.print("\nWelcome to the AI Interview Agent!")
-            self.console.print("This is a mock interview to help you prepare for real interviews.\n")
-        else:
-            print("\nWelcome to the AI Interview Agent!")
-            print("This is a mock interview to help you prepare for real interviews.\n")
+        self.ui.line("\nWelcome to the AI Interview Agent!")
+        self.ui.line("This is a mock interview to help you prepare for real interviews.\n")
         
         # Select role and experience
         role = self.select_role()
@@ -376,78 +478,59 @@ class InterviewSession:
             initial_difficulty=initial_difficulty,
         )
         
-        if self.console:
-            self.console.print(f"\n[bold green]Starting interview for {role} ({experience_level} level)[/bold green]")
-            self.console.print(f"You will be asked up to {self.max_questions} questions.\n")
-            self.console.print("[dim]Press Enter to begin...[/dim]")
-        else:
-            print(f"\nStarting interview for {role} ({experience_level} level)")
-            print(f"You will be asked up to {self.max_questions} questions.\n")
-            print("Press Enter to begin...")
+        self.ui.line(f"\nStarting interview for {role} ({experience_level} level)", style="bold green")
+        self.ui.line(f"You will be asked up to {self.max_questions} questions.\n")
+        self.ui.line("Press Enter to begin...", style="dim")
         
-        input()
+        # The next question is selected while the user is still reading; it
+        # only depends on session state, which is final by the time we ask
+        next_question = self._prefetch_question(role, experience_level)
+        try:
+            await read_input()
+            await self._interview_loop(role, experience_level, next_question)
+        finally:
+            next_question = self._next_question
+            if next_question is not None and not next_question.done():
+                next_question.cancel()
         
-        # Interview loop
+        # Generate final report
+        with self.ui.status("Generating your interview report..."):
+            await self._generate_report(role, experience_level)
+    
+    def _prefetch_question(self, role: str, experience_level: str) -> "asyncio.Task":
+        """Start selecting the next question from the current session state."""
+        self._next_question = asyncio.create_task(self.question_selector.execute(
+            role=role,
+            experience_level=experience_level,
+            difficulty=self.state.current_difficulty,
+            asked_question_ids=self.state.asked_question_ids,
+            asked_topics=self.state.asked_topics,
+        ))
+        return self._next_question
+    
+    async def _interview_loop(self, role: str, experience_level: str, next_question: "asyncio.Task"):
+        """Ask, evaluate and record questions until done or the user quits."""
         question_num = 0
         while question_num < self.max_questions:
             question_num += 1
             
-            # Get next question
-            if self.console:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=self.console,
-                ) as progress:
-                    progress.add_task("Preparing question...", total=None)
-                    question = await self.question_selector.execute(
-                        role=role,
-                        experience_level=experience_level,
-                        difficulty=self.state.current_difficulty,
-                        asked_question_ids=self.state.asked_question_ids,
-                        asked_topics=self.state.asked_topics,
-                    )
-            else:
-                print("\nPreparing question...")
-                question = await self.question_selector.execute(
-                    role=role,
-                    experience_level=experience_level,
-                    difficulty=self.state.current_difficulty,
-                    asked_question_ids=self.state.asked_question_ids,
-                    asked_topics=self.state.asked_topics,
-                )
+            # Get next question, usually already prefetched
+            with self.ui.status("Preparing question..."):
+                question = await next_question
             
             # Display question
             print_question(question, question_num, self.max_questions, self.console)
             
             # Get answer
-            answer = self.get_user_answer()
+            answer = await self.get_user_answer()
             
             # Check for quit
             if answer.lower() in ['quit', 'exit', 'q']:
-                if self.console:
-                    self.console.print("\n[yellow]Interview ended early.[/yellow]")
-                else:
-                    print("\nInterview ended early.")
+                self.ui.line("\nInterview ended early.", style="yellow")
                 break
             
             # Evaluate answer
-            if self.console:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=self.console,
-                ) as progress:
-                    progress.add_task("Evaluating your answer...", total=None)
-                    evaluation = await self.evaluator.execute(
-                        question=question["question_text"],
-                        answer=answer,
-                        question_type=question.get("question_type", "technical"),
-                        ideal_answer_points=question.get("ideal_answer_points", []),
-                        experience_level=experience_level,
-                    )
-            else:
-                print("\nEvaluating your answer...")
+            with self.ui.status("Evaluating your answer..."):
                 evaluation = await self.evaluator.execute(
                     question=question["question_text"],
                     answer=answer,
@@ -492,28 +575,19 @@ class InterviewSession:
             
             # Continue prompt
             if question_num < self.max_questions:
-                if self.console:
-                    self.console.print("\n[dim]Press Enter for next question (or type 'quit' to end)...[/dim]")
-                else:
-                    print("\nPress Enter for next question (or type 'quit' to end)...")
+                # Difficulty and asked topics are updated, so the next
+                # question can be selected while the user reads the feedback
+                next_question = self._prefetch_question(role, experience_level)
                 
-                user_input = input()
+                self.ui.line("\nPress Enter for next question (or type 'quit' to end)...", style="dim")
+                
+                try:
+                    user_input = await read_input()
+                except EOFError:
+                    # Scripted input ran out; finish with what was answered
+                    break
                 if user_input.lower() in ['quit', 'exit', 'q']:
                     break
-        
-        # Generate final report
-        if self.console:
-            self.console.print("\n")
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                progress.add_task("Generating your interview report...", total=None)
-                await self._generate_report(role, experience_level)
-        else:
-            print("\nGenerating your interview report...")
-            await self._generate_report(role, experience_level)
     
     async def _generate_report(self, role: str, experience_level: str):
         """Generate and display the final report."""
@@ -523,8 +597,8 @@ class InterviewSession:
             role=role,
             experience_level=experience_level,
             performance_summary=performance_summary,
-            all_strengths=self.all_strengths,
-            all_weaknesses=self.all_weaknesses,
+            all_strengths=list(self.all_strengths),
+            all_weaknesses=list(self.all_weaknesses),
         )
         
         print_report(report, self.console)
@@ -536,17 +610,18 @@ class InterviewSession:
 
 def ensure_directories():
     """Ensure required directories exist."""
-    dirs = ["logs", "temp"]
-    base_path = Path(__file__).parent
+    # Usually they already do, and a stat each is all that takes
+    if all(dir_path.is_dir() for dir_path in _REQUIRED_DIRS):
+        return
     
-    for dir_name in dirs:
-        dir_path = base_path / dir_name
+    for dir_path in _REQUIRED_DIRS:
         dir_path.mkdir(exist_ok=True)
 
 
 def main():
     """Main entry point for the AI Interview Agent."""
     ensure_directories()
+    _load_dependencies()
     
     console = get_console()
     session = InterviewSession(console)
@@ -554,15 +629,9 @@ def main():
     try:
         asyncio.run(session.run_interview())
     except KeyboardInterrupt:
-        if console:
-            console.print("\n\n[yellow]Interview interrupted. Goodbye![/yellow]")
-        else:
-            print("\n\nInterview interrupted. Goodbye!")
+        session.ui.line("\n\nInterview interrupted. Goodbye!", style="yellow")
     except Exception as e:
-        if console:
-            console.print(f"\n[bold red]Error: {str(e)}[/bold red]")
-        else:
-            print(f"\nError: {str(e)}")
+        session.ui.line(f"\nError: {str(e)}", style="bold red")
         raise
 
 
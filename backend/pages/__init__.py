@@ -1,12 +1,19 @@
 """
 Pages module for the AI Interview Agent web application.
+
+Page modules are imported on first access, so importing one page (or this
+package) does not pull in every other page and its dependencies.
 """
-from pages.home_page import render_home_page
-from pages.login_page import render_login_page
-from pages.interview_page import render_interview_page
-from pages.results_page import render_results_page
-from pages.history_page import render_history_page
-from pages.admin_page import render_admin_page
+from importlib import import_module
+
+_PAGE_MODULES = {
+    "render_home_page": "pages.home_page",
+    "render_login_page": "pages.login_page",
+    "render_interview_page": "pages.interview_page",
+    "render_results_page": "pages.results_page",
+    "render_history_page": "pages.history_page",
+    "render_admin_page": "pages.admin_page",
+}
 
 __all__ = [
     "render_home_page",
@@ -16,3 +23,12 @@ __all__ = [
     "render_history_page",
     "render_admin_page"
 ]
+
+
+def __getattr__(name):
+    """Import the page module that defines ``name`` on first access."""
+    if name not in _PAGE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_PAGE_MODULES[name]), name)
+    globals()[name] = value
+    return value
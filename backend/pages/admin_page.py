@@ -1,13 +1,82 @@
 """
 Admin/Review Page - Compare candidates and view aggregate results.
 """
+import io
+import json
+
 import streamlit as st
-import pandas as pd
 from app.utils.history_db import get_history_db
 
 
+_METRIC_CARD_TEMPLATE = """
+<div class="metric-card">
+    <div class="metric-value">{value}</div>
+    <div class="metric-label">{label}</div>
+</div>
+"""
+
+# The four cards go out as one markdown element instead of four columns
+_METRIC_GRID_TEMPLATE = (
+    '<div style="display:grid;grid-template-columns:repeat(4,1fr);gap:1rem">{cards}</div>'
+)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_dashboard_data():
+    """Load stats, interviews and the metrics overview HTML; reused across reruns for 30s."""
+    db = get_history_db()
+    stats = db.get_performance_stats()
+    cards = "".join(
+        _METRIC_CARD_TEMPLATE.format_map({"value": value, "label": label}).strip()
+        for value, label in (
+            (stats['total_interviews'], "Total Interviews"),
+            (f"{stats['average_score']:.1f}", "Avg Score"),
+            (len(stats['by_role']), "Roles Tracked"),
+            (len(stats['by_experience']), "Experience Levels"),
+        )
+    )
+    return stats, db.get_all_interviews(), _METRIC_GRID_TEMPLATE.format(cards=cards)
+
+
+# The export helpers are keyed on the interview count only; the leading
+# underscore keeps Streamlit from hashing the full history on every call.
+# One entry each: an older count's export is never wanted again.
+@st.cache_data(show_spinner=False, max_entries=1)
+def _serialize_json_sections(version, _interviews, _stats):
+    """Serialize the interviews and statistics as a pretty-printed JSON object."""
+    return json.dumps({"interviews": _interviews, "statistics": _stats}, indent=2)
+
+
+def _serialize_json(version, interviews, stats):
+    """Serialize the full export as JSON bytes, stamped with the current time."""
+    import pandas as pd
+    
+    metadata = json.dumps({
+        "export_date": pd.Timestamp.now().isoformat(),
+        "total_interviews": stats['total_interviews'],
+        "average_score": stats['average_score']
+    }, indent=2).replace("\n", "\n  ")
+    # The cached object opens with "{\n" and its keys are already indented
+    # one level, so the metadata key is prepended to the same object
+    sections = _serialize_json_sections(version, interviews, stats)
+    return f'{{\n  "metadata": {metadata},\n{sections[2:]}'.encode()
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _serialize_csv(version, _interviews):
+    """Serialize the interviews as CSV bytes."""
+    import pandas as pd
+    
+    # Encoded as it is written, rather than building the whole str first
+    buffer = io.BytesIO()
+    pd.DataFrame(_interviews).to_csv(buffer, index=False, encoding="utf-8")
+    return buffer.getvalue()
+
+
 def render_admin_page():
     """Render the admin/review page for comparing candidates."""
+    # pandas is only needed once the page renders, not when it is imported
+    import pandas as pd
     
     # Back button
     col1, col2 = st.columns([1, 5])
@@ -29,46 +98,12 @@ def render_admin_page():
     </div>
     """, unsafe_allow_html=True)
     
-    # Initialize database
-    db = get_history_db()
-    
-    # Get overall stats
-    stats = db.get_performance_stats()
+    # Get overall stats; Streamlit reruns this page on every widget
+    # interaction, so the queries and card HTML come from a short-lived cache
+    stats, all_interviews, metrics_overview = _load_dashboard_data()
     
     # Stats overview
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{stats['total_interviews']}</div>
-            <div class="metric-label">Total Interviews</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{stats['average_score']:.1f}</div>
-            <div class="metric-label">Avg Score</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{len(stats['by_role'])}</div>
-            <div class="metric-label">Roles Tracked</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{len(stats['by_experience'])}</div>
-            <div class="metric-label">Experience Levels</div>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(metrics_overview, unsafe_allow_html=True)
     
     st.markdown("<br/>", unsafe_allow_html=True)
     
@@ -90,8 +125,6 @@ def render_admin_page():
     
     with tab2:
         # All candidates table
-        all_interviews = db.get_all_interviews()
-        
         if all_interviews:
             df_candidates = pd.DataFrame(all_interviews)
             df_candidates = df_candidates[['candidate_name', 'role', 'experience_level', 'final_score', 'total_questions', 'created_at']]
@@ -129,15 +162,17 @@ def render_admin_page():
             st.markdown("### Average Performance by Role")
             st.dataframe(df_role_perf, hide_index=True, use_container_width=True)
             
-            # Top performers by role
+            # Top performers by role, from the interviews already loaded: one
+            # stable sort (newest first on ties) and the top five per role
             st.markdown("### Top Performers by Role")
-            for role_stat in stats['by_role']:
-                role_interviews = db.get_interviews_by_role(role_stat['role'])
-                if role_interviews:
-                    top_performers = sorted(role_interviews, key=lambda x: x['final_score'] or 0, reverse=True)[:5]
-                    st.markdown(f"#### {role_stat['role']}")
-                    for perf in top_performers:
-                        st.markdown(f"- **{perf['candidate_name']}**: {perf['final_score']:.2f}/10")
+            if all_interviews:
+                df_top = pd.DataFrame(all_interviews)
+                df_top['final_score'] = pd.to_numeric(df_top['final_score'], errors='coerce').fillna(0)
+                df_top = df_top.sort_values('final_score', ascending=False, kind='stable')
+                for role, top_performers in df_top.groupby('role').head(5).groupby('role'):
+                    st.markdown(f"#### {role}")
+                    for name, score in zip(top_performers['candidate_name'], top_performers['final_score']):
+                        st.markdown(f"- **{name}**: {score:.2f}/10")
     
     with tab4:
         # Performance trends
@@ -179,30 +214,18 @@ def render_admin_page():
     
     with col1:
         if st.button("Export All Data (JSON)", use_container_width=True):
-            all_data = {
-                "metadata": {
-                    "export_date": pd.Timestamp.now().isoformat(),
-                    "total_interviews": stats['total_interviews'],
-                    "average_score": stats['average_score']
-                },
-                "interviews": db.get_all_interviews(),
-                "statistics": stats
-            }
             st.download_button(
                 label="Download JSON",
-                data=pd.json.dumps(all_data, indent=2),
+                data=_serialize_json(stats['total_interviews'], all_interviews, stats),
                 file_name=f"interview_data_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
     
     with col2:
         if st.button("Export All Data (CSV)", use_container_width=True):
-            all_interviews = db.get_all_interviews()
-            df_export = pd.DataFrame(all_interviews)
-            csv = df_export.to_csv(index=False)
             st.download_button(
                 label="Download CSV",
-                data=csv,
+                data=_serialize_csv(stats['total_interviews'], all_interviews),
                 file_name=f"interview_data_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
@@ -0,0 +1,118 @@
+"""
+Tests for error handler
+"""
+import logging
+import time
+
+from app.utils.error_handler import ErrorHandler, ErrorContext, ErrorCategory, ErrorSeverity
+
+
+def test_identical_burst_errors_are_coalesced():
+    """Test repeated errors within the dedup window are counted, not recorded"""
+    handler = ErrorHandler()
+    context = ErrorContext(operation="answer_evaluation")
+
+    for _ in range(5):
+        handler.handle_error(ConnectionError("service down"), context)
+
+    assert len(handler.recent_errors) == 1
+    assert handler.error_counts[ErrorCategory.NETWORK] == 5
+
+
+def test_burst_errors_recorded_again_after_window():
+    """Test a new window records the error again"""
+    handler = ErrorHandler()
+    handler.dedup_window_seconds = 0
+    context = ErrorContext(operation="answer_evaluation")
+
+    for _ in range(3):
+        handler.handle_error(ConnectionError("service down"), context)
+
+    assert len(handler.recent_errors) == 3
+
+
+def test_distinct_errors_not_coalesced():
+    """Test different error types are reported separately"""
+    handler = ErrorHandler()
+    context = ErrorContext(operation="question_generation")
+
+    handler.handle_error(ConnectionError("service down"), context)
+    handler.handle_error(TimeoutError("slow"), context)
+
+    summary = handler.get_error_summary()
+    assert summary["total_errors"] == 2
+    assert summary["category_distribution"] == {"network": 1, "timeout": 1}
+
+
+def test_severity_and_category_follow_exception_subclasses():
+    """Test classification matches subclasses of registered exception types"""
+    handler = ErrorHandler()
+    report = handler.handle_error(
+        ConnectionRefusedError("refused"), ErrorContext(operation="llm_call")
+    )
+
+    assert report.severity == ErrorSeverity.MEDIUM
+    assert report.category == ErrorCategory.NETWORK
+
+
+def test_report_dict_reflects_later_changes():
+    """Test to_dict picks up fields set after the first call and is not shared"""
+    handler = ErrorHandler()
+    report = handler.handle_error(ValueError("bad input"), ErrorContext(operation="resume_upload"))
+
+    first = report.to_dict()
+    first["error_message"] = "tampered"
+    report.recovery_action = "Correct input data and resubmit request"
+    report.context.additional_data["field"] = "email"
+    report.context.user_id = "u1"
+
+    second = report.to_dict()
+    assert second["error_message"] == "bad input"
+    assert second["recovery_action"] == "Correct input data and resubmit request"
+    assert second["context"]["additional_data"] == {"field": "email"}
+    assert second["context"]["user_id"] == "u1"
+
+
+def test_suppressed_count_logged_when_burst_window_closes(caplog):
+    """Test the rollup is logged by the timer even if the error never recurs"""
+    handler = ErrorHandler()
+    handler.dedup_window_seconds = 0.05
+    context = ErrorContext(operation="answer_evaluation")
+
+    with caplog.at_level(logging.WARNING, logger="app.utils.error_handler"):
+        for _ in range(4):
+            handler.handle_error(ConnectionError("service down"), context)
+        time.sleep(0.3)
+
+    assert any(
+        record.getMessage() == "ConnectionError in answer_evaluation: 3 duplicate occurrences suppressed within 0.05s"
+        for record in caplog.records
+    )
+    assert handler._burst_counts == {}
+
+
+def test_summary_flushes_pending_suppressed_counts(caplog):
+    """Test reading the summary logs counts still inside their window"""
+    handler = ErrorHandler()
+    handler.dedup_window_seconds = 60
+    context = ErrorContext(operation="answer_evaluation")
+    for _ in range(3):
+        handler.handle_error(ConnectionError("service down"), context)
+
+    with caplog.at_level(logging.WARNING, logger="app.utils.error_handler"):
+        handler.get_error_summary()
+
+    assert [record.suppressed_count for record in caplog.records if hasattr(record, "suppressed_count")] == [2]
+
+
+def test_unrepeated_burst_keys_are_dropped_once_expired():
+    """Test one-off errors do not accumulate burst entries"""
+    handler = ErrorHandler()
+    handler.dedup_window_seconds = 0.05
+    for i in range(50):
+        handler.handle_error(ValueError("bad input"), ErrorContext(operation=f"upload_{i}"))
+    time.sleep(0.06)
+
+    handler.handle_error(ValueError("bad input"), ErrorContext(operation="upload_last"))
+
+    assert list(handler._burst_counts) == [("upload_last", "ValueError", ErrorCategory.VALIDATION)]
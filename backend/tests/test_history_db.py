@@ -0,0 +1,90 @@
+"""
+Tests for interview history database
+"""
+import sqlite3
+
+import pytest
+from app.utils.history_db import InterviewHistoryDB
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    """Create a history database in a temporary directory"""
+    return InterviewHistoryDB(db_path=str(tmp_path / "history.db"))
+
+
+def make_session(session_id="session-1", candidate_name="Alice", role="Backend Engineer", score=7.5):
+    return {
+        "session_id": session_id,
+        "candidate_name": candidate_name,
+        "role": role,
+        "experience_level": "mid",
+        "company": "Acme",
+        "average_score": score,
+        "current_question_num": 2,
+        "strengths": ["Clear communication"],
+        "weaknesses": ["System design depth"],
+        "detailed_coverage": {
+            "history": [
+                {"question": "Explain REST", "type": "technical", "topic": "api",
+                 "answer": "...", "score": 8.0, "feedback": "Good",
+                 "strengths": ["Precise"], "improvements": []},
+                {"question": "Tell me about a conflict", "type": "behavioral", "topic": "teamwork",
+                 "answer": "...", "score": 7.0, "feedback": "OK"},
+            ]
+        },
+    }
+
+
+def test_save_and_get_interview_with_questions(history_db):
+    """Test an interview round-trips with its questions"""
+    interview_id = history_db.save_interview(make_session())
+
+    interview = history_db.get_interview_by_id(interview_id)
+    assert interview["candidate_name"] == "Alice"
+    assert interview["strengths"] == ["Clear communication"]
+    assert [q["question_text"] for q in interview["questions"]] == [
+        "Explain REST", "Tell me about a conflict"
+    ]
+    assert interview["questions"][0]["strengths"] == ["Precise"]
+    assert interview["questions"][1]["improvements"] == []
+
+
+def test_get_interview_by_id_missing(history_db):
+    """Test unknown IDs return None"""
+    assert history_db.get_interview_by_id(999) is None
+
+
+def test_filter_by_candidate_and_role(history_db):
+    """Test candidate and role lookups"""
+    history_db.save_interview(make_session("s1", "Alice", "Backend Engineer"))
+    history_db.save_interview(make_session("s2", "Bob", "Backend Engineer"))
+    history_db.save_interview(make_session("s3", "Alice", "Data Scientist"))
+
+    assert {i["session_id"] for i in history_db.get_interviews_by_candidate("Alice")} == {"s1", "s3"}
+    assert {i["session_id"] for i in history_db.get_interviews_by_role("Backend Engineer")} == {"s1", "s2"}
+    assert len(history_db.get_all_interviews()) == 3
+
+
+def test_performance_stats(history_db):
+    """Test aggregate statistics"""
+    history_db.save_interview(make_session("s1", "Alice", "Backend Engineer", score=6.0))
+    history_db.save_interview(make_session("s2", "Bob", "Backend Engineer", score=8.0))
+
+    stats = history_db.get_performance_stats()
+    assert stats["total_interviews"] == 2
+    assert stats["average_score"] == 7.0
+    assert stats["by_role"] == [{"role": "Backend Engineer", "count": 2, "avg_score": 7.0}]
+    assert stats["by_experience"] == [{"level": "mid", "count": 2, "avg_score": 7.0}]
+
+
+def test_reads_use_read_only_pool(history_db):
+    """Test pooled reader connections see committed writes but cannot write"""
+    history_db.save_interview(make_session())
+
+    with history_db._read() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM interviews").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM interviews")
+
+    assert len(history_db.get_all_interviews()) == 1
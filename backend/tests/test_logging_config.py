@@ -0,0 +1,100 @@
+"""
+Tests for logging configuration
+"""
+import logging
+import queue
+import sys
+
+from app.utils.logging_config import (
+    BatchedRotatingFileHandler,
+    DeferredQueueHandler,
+    FlushingQueueListener,
+    start_queue_logging,
+    stop_logging,
+)
+
+
+def make_record(message):
+    return logging.LogRecord("app", logging.INFO, __file__, 1, message, (), None)
+
+
+def test_batched_handler_rotates_on_tracked_size(tmp_path):
+    """Test rollover happens at maxBytes using the in-process size count"""
+    log_file = tmp_path / "app.log"
+    log_file.write_text("x" * 40 + "\n")
+    handler = BatchedRotatingFileHandler(str(log_file), maxBytes=100, backupCount=2)
+
+    assert handler._size == 41
+    for i in range(6):
+        handler.emit(make_record(f"record {i:02d} " + "y" * 10))
+    handler.close()
+
+    assert (tmp_path / "app.log.1").exists()
+    for path in tmp_path.iterdir():
+        assert path.stat().st_size < 100
+    lines = (tmp_path / "app.log.1").read_text().splitlines() + log_file.read_text().splitlines()
+    assert lines[-1].startswith("record 05")
+
+
+def test_batched_handler_counts_encoded_bytes(tmp_path):
+    """Test the tracked size matches the file size for non-ASCII records"""
+    log_file = tmp_path / "app.log"
+    handler = BatchedRotatingFileHandler(str(log_file), maxBytes=10_000, encoding="utf-8")
+
+    for _ in range(10):
+        handler.emit(make_record("é" * 40))
+    handler.close()
+
+    assert handler._size == log_file.stat().st_size == 810
+
+
+def test_stop_logging_closes_listener_handlers(tmp_path):
+    """Test restarting queue logging releases the previous log file"""
+    handler = BatchedRotatingFileHandler(str(tmp_path / "app.log"), maxBytes=10_000)
+    assert handler.stream is not None
+    start_queue_logging(handler)
+    stop_logging()
+
+    assert handler.stream is None
+
+
+def test_listener_flushes_when_queue_drains(tmp_path):
+    """Test buffered records reach the file once the listener goes idle"""
+    log_file = tmp_path / "app.log"
+    handler = BatchedRotatingFileHandler(str(log_file), maxBytes=10_000)
+    log_queue = queue.Queue()
+    listener = FlushingQueueListener(log_queue, handler)
+    listener.start()
+
+    for i in range(3):
+        log_queue.put(make_record(f"record {i}"))
+    log_queue.join()
+    listener.stop()
+    listener.flush()
+
+    assert log_file.read_text().splitlines() == ["record 0", "record 1", "record 2"]
+    handler.close()
+
+
+def test_queue_handler_pins_message_and_traceback_on_caller():
+    """Test queued records carry the message and traceback as of the log call"""
+    log_queue = queue.Queue()
+    handler = DeferredQueueHandler(log_queue)
+    steps = ["save"]
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("app", logging.ERROR, __file__, 1, "failed %s", (steps,), sys.exc_info())
+    record.operation = "resume_upload"
+
+    handler.handle(record)
+    steps.append("retry")
+    queued = log_queue.get_nowait()
+
+    assert queued is not record
+    assert queued.getMessage() == "failed ['save']"
+    assert queued.args is None
+    assert queued.exc_info is None
+    assert "ValueError: boom" in queued.exc_text
+    assert queued.operation == "resume_upload"
+    assert "ValueError: boom" in logging.Formatter().format(queued)
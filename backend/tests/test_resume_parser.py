@@ -0,0 +1,113 @@
+"""
+Tests for resume parser
+"""
+import copy
+
+import fitz
+import pytest
+from app.utils.resume_parser import ResumeParser
+
+
+RESUME_TEXT = """
+Jane Doe
+Summary: Backend engineer with 6 years of experience building APIs.
+Skills: Python, Django, PostgreSQL, Docker, Kubernetes, AWS, REST, GraphQL, Linux
+Projects: Built a real-time analytics pipeline using Python and Kafka on AWS.
+Developed a GraphQL gateway in Node.js serving 1M requests per day.
+Education: BS in Computer Science from State University
+Experience: 2016 - 2022 Acme Corp
+"""
+
+
+@pytest.fixture
+def parser():
+    return ResumeParser()
+
+
+def make_pdf(text):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
+
+def test_extract_skills_by_category(parser):
+    """Test skills are bucketed and deduplicated"""
+    result = parser._extract_information(RESUME_TEXT)
+
+    assert {"python", "django", "postgresql", "docker", "kubernetes", "aws", "node.js"} <= set(
+        result["programming_languages"]
+    )
+    assert {"rest", "graphql", "linux"} <= set(result["technologies"])
+    assert len(result["skills"]) == len(set(result["skills"]))
+    assert set(result["skills"]) == set(result["programming_languages"]) | set(result["technologies"])
+
+
+def test_extract_projects_with_technologies(parser):
+    """Test project descriptions carry the technologies they mention"""
+    projects = parser._extract_information(RESUME_TEXT)["projects"]
+
+    assert projects
+    assert len(projects) <= 5
+    pipeline = next(p for p in projects if "analytics pipeline" in p["description"].lower())
+    assert {"python", "aws"} <= set(pipeline["technologies_used"])
+
+
+def test_projects_are_windowed_and_capped(parser):
+    """Test unpunctuated text yields bounded project descriptions, at most five"""
+    text = " ".join(["built a service with python and docker"] * 50)
+    projects = parser._extract_projects(text)
+
+    assert len(projects) == 5
+    assert all(len(p["description"]) <= 300 for p in projects)
+    assert {"python", "docker"} <= set(projects[0]["technologies_used"])
+
+
+def test_experience_education_and_summary(parser):
+    """Test experience years, education and summary extraction"""
+    result = parser._extract_information(RESUME_TEXT)
+
+    assert result["experience_years"] == 6
+    assert any("computer science" in edu for edu in result["education"])
+    assert result["summary"].lower().startswith("jane doe summary")
+
+
+def test_experience_falls_back_to_year_range(parser):
+    """Test experience is estimated from year mentions when not stated"""
+    result = parser._extract_information("Worked at Acme from 2015 to 2019 as an engineer")
+
+    assert result["experience_years"] == 4
+
+
+def test_invalid_pdf_returns_empty_result(parser):
+    """Test non-PDF input yields the empty result"""
+    result = parser.parse_pdf_resume(b"not a pdf")
+
+    assert result == parser._get_empty_result()
+
+
+def test_repeated_parse_is_served_from_cache(parser, monkeypatch):
+    """Test identical PDF bytes are parsed once, hits are private copies and the cache stays bounded"""
+    pdf_bytes = make_pdf("Skills: Python, Docker. Built an API with Flask.")
+    extract = parser._extract_information
+    calls = []
+    monkeypatch.setattr(parser, "_extract_information", lambda text: calls.append(text) or extract(text))
+
+    first = parser.parse_pdf_resume(pdf_bytes)
+    assert "python" in first["skills"]
+    expected = copy.deepcopy(first)
+    first["skills"].append("cobol")
+
+    second = parser.parse_pdf_resume(pdf_bytes)
+    assert len(calls) == 1
+    assert second == expected
+    assert second["skills"] is not first["skills"]
+    second["projects"].append("tampered")
+    assert parser.parse_pdf_resume(pdf_bytes) == expected
+
+    parser.max_cached_results = 1
+    parser.parse_pdf_resume(make_pdf("Skills: Rust"))
+    assert len(parser._cache) == 1
+    assert parser.parse_pdf_resume(pdf_bytes) == expected
+    assert len(calls) == 3
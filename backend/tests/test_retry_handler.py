@@ -0,0 +1,238 @@
+"""
+Tests for retry handler
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+from app.utils import retry_handler
+from app.utils.retry_handler import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitState,
+    RetryConfig,
+    RetryHandler,
+)
+
+
+async def succeed():
+    return "ok"
+
+
+async def fail():
+    raise ConnectionError("down")
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_success_keeps_circuit_closed():
+    """Test successful calls pass through a closed circuit"""
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig())
+
+    assert await breaker.call(succeed) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.metrics.success_count == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_rejects():
+    """Test the circuit opens at the failure threshold and rejects calls"""
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(failure_threshold=2))
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(Exception, match="is OPEN"):
+        await breaker.call(succeed)
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_closes_after_successes():
+    """Test a half-open circuit closes after the success threshold"""
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(success_threshold=2, gradual_recovery=False))
+    breaker._transition_to_half_open()
+
+    await breaker.call(succeed)
+    assert breaker.state == CircuitState.HALF_OPEN
+    await breaker.call(succeed)
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_records_one_failure_per_attempt():
+    """Test each failed attempt is recorded once and retries stop on success"""
+    handler = RetryHandler()
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(failure_threshold=10))
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("down")
+        return "ok"
+
+    config = RetryConfig(max_attempts=3, base_delay=0, jitter=False)
+    result = await handler.execute_with_retry(flaky, retry_config=config, circuit_breaker=breaker)
+
+    assert result == "ok"
+    assert len(calls) == 3
+    assert breaker.metrics.failure_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_non_retryable_recorded_once():
+    """Test a non-retryable error is raised immediately and recorded once"""
+    handler = RetryHandler()
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig())
+
+    async def broken():
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError):
+        await handler.execute_with_retry(broken, circuit_breaker=breaker)
+
+    assert breaker.metrics.failure_count == 1
+
+
+def test_open_circuit_half_opens_after_timeout():
+    """Test an open circuit moves to half-open once its timeout elapses"""
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(timeout=0.05))
+    breaker._transition_to_open()
+    breaker.metrics.last_failure_time = time.monotonic()
+
+    assert breaker.is_open()
+    breaker.metrics.last_failure_time -= 1
+    assert not breaker.is_open()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.get_status()["last_failure"] is not None
+
+
+def test_retry_delays_are_capped_exponential():
+    """Test backoff doubles per attempt up to max_delay"""
+    config = RetryConfig(max_attempts=5, base_delay=1.0, max_delay=5.0, jitter=False)
+
+    assert [config.get_delay(attempt) for attempt in range(6)] == [1.0, 2.0, 4.0, 5.0, 5.0, 5.0]
+
+
+def test_full_jitter_stays_within_backoff():
+    """Test jittered delays fall anywhere in [0, backoff]"""
+    config = RetryConfig(max_attempts=3, base_delay=1.0)
+    delays = [config.get_delay(2) for _ in range(200)]
+
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert min(delays) < 2.0
+
+
+def test_circuit_breaker_shared_across_event_loops():
+    """Test one breaker records outcomes from separate threads and event loops"""
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(failure_threshold=1000))
+
+    def worker():
+        async def run():
+            for _ in range(50):
+                await breaker._record_failure()
+        asyncio.run(run())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert breaker.metrics.failure_count == 200
+
+
+def test_circuit_breaker_registry_is_shared_and_bounded():
+    """Test breakers are reused by name and the least recently used is evicted"""
+    handler = RetryHandler()
+    handler.MAX_CIRCUIT_BREAKERS = 2
+
+    first = handler.get_circuit_breaker("a")
+    assert handler.get_circuit_breaker("a") is first
+    handler.get_circuit_breaker("b")
+    handler.get_circuit_breaker("a")
+    handler.get_circuit_breaker("c")
+
+    assert list(handler.circuit_breakers) == ["a", "c"]
+    assert set(handler.get_metrics()) == {"a", "c"}
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_rejects_when_circuit_open():
+    """Test an open circuit rejects the call without running the operation"""
+    handler = RetryHandler()
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig())
+    breaker._transition_to_open()
+    breaker.metrics.last_failure_time = time.monotonic()
+    calls = []
+
+    async def operation():
+        calls.append(1)
+
+    with pytest.raises(Exception, match="is OPEN"):
+        await handler.execute_with_retry(operation, circuit_breaker=breaker)
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_half_open_limits_concurrent_probes():
+    """Test a half-open circuit fails fast once its probe slots are taken"""
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(success_threshold=1))
+    breaker._transition_to_half_open()
+    release = asyncio.Event()
+
+    async def slow_probe():
+        await release.wait()
+        return "ok"
+
+    probe = asyncio.create_task(breaker.call(slow_probe))
+    await asyncio.sleep(0)
+    with pytest.raises(Exception, match="is OPEN"):
+        await breaker.call(succeed)
+
+    release.set()
+    assert await probe == "ok"
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker._probes_in_flight == 0
+
+
+def test_retryable_exceptions_match_subclasses():
+    """Test retryable checks follow exception inheritance"""
+    config = RetryConfig()
+
+    assert config.is_retryable(ConnectionRefusedError())
+    assert config.is_retryable(TimeoutError())
+    assert not config.is_retryable(ValueError())
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_without_wait_for_ignores_timeout():
+    """Test operations run unwrapped when they enforce their own timeout"""
+    handler = RetryHandler()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    config = RetryConfig(max_attempts=1, timeout=0.01, use_wait_for=False)
+
+    assert await handler.execute_with_retry(slow, retry_config=config) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_half_open_admits_traffic_gradually(monkeypatch):
+    """Test the share of admitted half-open calls grows with each success"""
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(success_threshold=4))
+    breaker._transition_to_half_open()
+    monkeypatch.setattr(retry_handler.random, "random", lambda: 0.4)
+
+    # 1/4 of calls admitted at first, so a 0.4 draw is rejected
+    with pytest.raises(Exception, match="is OPEN"):
+        await breaker.call(succeed)
+
+    breaker.metrics.success_count = 1
+    assert await breaker.call(succeed) == "ok"
+    assert breaker.metrics.success_count == 2
+    assert breaker.state == CircuitState.HALF_OPEN
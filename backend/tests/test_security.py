@@ -0,0 +1,73 @@
+"""
+Tests for security utilities
+"""
+import time
+from datetime import timedelta
+
+from app.utils import security
+from app.utils.security import (
+    create_access_token,
+    decode_token,
+    hash_password,
+    pwd_context,
+    verify_password,
+)
+
+
+def test_hash_and_verify_password():
+    """Test a password verifies against its own hash only"""
+    hashed = hash_password("correct horse")
+
+    assert verify_password("correct horse", hashed)
+    assert not verify_password("wrong horse", hashed)
+
+
+def test_long_password_truncated_on_character_boundary():
+    """Test passwords over 72 bytes are cut without splitting a character"""
+    password = "a" * 71 + "é" + "tail"  # "é" straddles the 72-byte limit
+    hashed = hash_password(password)
+
+    assert verify_password(password, hashed)
+    assert verify_password("a" * 71, hashed)
+    assert not verify_password("a" * 70, hashed)
+
+
+def test_existing_truncated_hashes_still_verify():
+    """Test hashes made with the old decode-based truncation keep verifying"""
+    password = "ü" * 40  # 80 bytes
+    legacy = pwd_context.hash(password.encode("utf-8")[:72].decode("utf-8", errors="ignore"))
+
+    assert verify_password(password, legacy)
+
+
+def test_decode_token_round_trip_and_cache():
+    """Test tokens decode, repeat decodes hit the cache and bad tokens fail"""
+    token = create_access_token({"sub": "alice@example.com"})
+
+    payload = decode_token(token)
+    assert payload["sub"] == "alice@example.com"
+    assert token in security._token_cache
+
+    # Cache hits hand out copies, so a caller mutating its payload is isolated
+    payload.pop("sub")
+    assert decode_token(token)["sub"] == "alice@example.com"
+
+    assert decode_token(token + "tampered") is None
+    assert token + "tampered" not in security._token_cache
+
+
+def test_cached_token_expires_with_jwt():
+    """Test a cached token is re-verified once its exp has passed"""
+    token = create_access_token({"sub": "bob@example.com"}, expires_delta=timedelta(seconds=-1))
+    security._token_cache[token] = ({"sub": "bob@example.com"}, time.time() - 1)
+
+    assert decode_token(token) is None
+    assert token not in security._token_cache
+
+
+def test_expired_and_malformed_tokens_rejected():
+    """Test expired or malformed tokens are rejected"""
+    expired = create_access_token({"sub": "carol@example.com"}, expires_delta=timedelta(minutes=-5))
+
+    assert decode_token(expired) is None
+    assert decode_token("not-a-jwt") is None
@@ -0,0 +1,101 @@
+"""
+Tests for structured logging
+"""
+import json
+import logging
+from datetime import datetime
+
+from app.utils.structured_logging import (
+    CorrelationFilter,
+    DetailedFormatter,
+    JSONFormatter,
+    correlation_id,
+    log_with_context,
+)
+
+
+def make_record(message="Answer evaluated", created=None):
+    record = logging.LogRecord("interview", logging.INFO, __file__, 1, message, (), None)
+    if created is not None:
+        record.created = created
+    return record
+
+
+def test_json_formatter_timestamps_match_isoformat():
+    """Test cached per-second timestamps match datetime's local ISO format"""
+    formatter = JSONFormatter()
+
+    for created in (1700000000.25, 1700000000.5, 1700000001.000123):
+        entry = json.loads(formatter.format(make_record(created=created)))
+        expected = datetime.fromtimestamp(created).isoformat(timespec="microseconds")
+        assert entry["timestamp"] == expected
+
+
+def test_json_formatter_includes_metrics_and_error_report():
+    """Test extra fields and structured error reports end up in the JSON"""
+    record = make_record()
+    record.metrics = {"score": 8.5, "topic": "api"}
+    record.error_report = {"error_id": "op_1", "category": "network", "severity": "medium"}
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["message"] == "Answer evaluated"
+    assert entry["metrics"] == {"score": 8.5, "topic": "api"}
+    assert entry["error_report"] == {"error_id": "op_1", "category": "network", "severity": "medium"}
+
+
+def test_detailed_formatter_summarizes_error_report():
+    """Test the human-readable formatter keeps the error report's classification"""
+    record = make_record("Error op_1: ConnectionError - down")
+    record.error_report = {"error_id": "op_1", "category": "network", "severity": "medium"}
+
+    line = DetailedFormatter("%(message)s").format(record)
+
+    assert line == "Error op_1: ConnectionError - down | Error: id=op_1 category=network severity=medium"
+
+
+def test_log_with_context_formats_lazily(caplog):
+    """Test args are %-formatted on emit and filtered levels are skipped"""
+    logger = logging.getLogger("interview.test")
+
+    with caplog.at_level(logging.INFO, logger="interview.test"):
+        log_with_context(logger, "DEBUG", "Question selected: %s", "api")
+        log_with_context(logger, "INFO", "Answer evaluated for question: %s", "q1",
+                         operation="answer_evaluation", metrics={"score": 7})
+
+    assert [r.getMessage() for r in caplog.records] == ["Answer evaluated for question: q1"]
+    assert caplog.records[0].operation == "answer_evaluation"
+    assert caplog.records[0].metrics == {"score": 7}
+
+
+def test_correlation_filter_only_tags_set_context():
+    """Test correlation fields are attached only when context is set"""
+    correlation_filter = CorrelationFilter()
+    record = make_record()
+
+    assert correlation_filter.filter(record)
+    assert not hasattr(record, "correlation_id")
+    assert json.loads(JSONFormatter().format(record))["correlation_id"] == ""
+
+    token = correlation_id.set("corr-1")
+    try:
+        record = make_record()
+        correlation_filter.filter(record)
+        assert record.correlation_id == "corr-1"
+    finally:
+        correlation_id.reset(token)
+
+
+def test_json_formatter_reused_entry_drops_previous_extras():
+    """Test extras from one record never leak into the next"""
+    formatter = JSONFormatter()
+    record = make_record()
+    record.metrics = {"score": 9}
+    record.operation = "answer_evaluation"
+    formatter.format(record)
+
+    entry = json.loads(formatter.format(make_record("Topic coverage updated")))
+
+    assert entry["message"] == "Topic coverage updated"
+    assert "metrics" not in entry and "operation" not in entry
+    assert list(entry)[:3] == ["timestamp", "level", "logger"]